@@ -0,0 +1,451 @@
+# Benchmark Suite: one timing harness for the algorithms of every unit
+
+import io
+import os
+import sys
+import json
+import math
+import time
+import random
+import argparse
+import platform
+import functools
+import importlib
+import threading
+import subprocess
+import tracemalloc
+from contextlib import redirect_stdout
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+INPUT_KINDS = ["sorted", "reversed", "random", "duplicates"]
+
+# ======================
+# Quick Timer (shared by the unit modules)
+# ======================
+def test_time(func, *args):
+    """Times a single call and prints it, as the unit demos do"""
+    start = time.perf_counter_ns()
+    result = func(*args)
+    elapsed = time.perf_counter_ns() - start
+    print(f"{func.__name__} executed in {elapsed / 1e9:.6f}s")
+    return result
+
+# ======================
+# Input Generators
+# ======================
+def generate_input(kind, n, seed=0, max_val=None):
+    """Integer list of size n that is sorted, reversed, random or mostly duplicates"""
+    rng = random.Random(seed)
+    max_val = max_val if max_val is not None else 10 * n
+    if kind == "duplicates":
+        distinct = max(1, int(math.sqrt(n)))
+        return [rng.randint(0, distinct) for _ in range(n)]
+    arr = [rng.randint(0, max_val) for _ in range(n)]
+    if kind == "sorted":
+        arr.sort()
+    elif kind == "reversed":
+        arr.sort(reverse=True)
+    return arr
+
+def _random_text(n, seed, alphabet="abcd"):
+    rng = random.Random(seed)
+    return "".join(rng.choice(alphabet) for _ in range(n))
+
+def _random_graph(n, seed):
+    """Connected weighted graph as both an adjacency list and an edge list"""
+    rng = random.Random(seed)
+    adj = {u: [] for u in range(n)}
+    edges = []
+    for v in range(1, n):
+        for u in {rng.randrange(v), rng.randrange(v)}:
+            w = rng.randint(1, 100)
+            adj[u].append((v, w))
+            adj[v].append((u, w))
+            edges.append((w, u, v))
+    return adj, edges
+
+def _random_intervals(n, seed):
+    """(start, end, weight) triples"""
+    rng = random.Random(seed)
+    return [(s, s + rng.randint(1, 50), rng.randint(1, 20))
+            for s in (rng.randint(0, 10 * n) for _ in range(n))]
+
+def _random_matrix(n, seed):
+    rng = random.Random(seed)
+    return [[0 if i == j else rng.randint(1, 100) for j in range(n)] for i in range(n)]
+
+# ======================
+# Registry: (module, function, sizes, kinds, args builder)
+# ======================
+# function may be a dotted path such as "Class.method"; the builder then
+# passes the instance as the first argument.
+# The builder gets (n, kind, seed) and returns a fresh argument tuple, so
+# in-place sorts never see already-sorted data on a repeat.
+# GrowthofFunctions is the catalog of growth models, not an algorithm, so it
+# has no entry here.
+ARRAY_SIZES = [1000, 4000, 16000]
+QUADRATIC_SIZES = [200, 400, 800]  # quick_sort recurses n deep on sorted input
+ARRAY = lambda n, kind, seed: (generate_input(kind, n, seed),)
+SORTED_WITH_TARGET = lambda n, kind, seed: (sorted(generate_input(kind, n, seed)), n * 5)
+
+CASES = [
+    ("IterativeAlgorithmn", "linear_search", ARRAY_SIZES, ["random"],
+     lambda n, kind, seed: (generate_input(kind, n, seed), -1)),
+    ("IterativeAlgorithmn", "binary_search", ARRAY_SIZES, ["random"], SORTED_WITH_TARGET),
+    ("IterativeAlgorithmn", "insertion_sort", QUADRATIC_SIZES, INPUT_KINDS, ARRAY),
+    ("IterativeAlgorithmn", "adaptive_insertion_sort", ARRAY_SIZES, INPUT_KINDS, ARRAY),
+    ("IterativeAlgorithmn", "batch_binary_search", ARRAY_SIZES, ["random"],
+     lambda n, kind, seed: (sorted(generate_input(kind, n, seed)), generate_input(kind, n, seed + 1))),
+    # find_many builds the index inside the timed call once the batch is large enough
+    ("IterativeAlgorithmn", "SearchIndex.find_many", ARRAY_SIZES, ["random"],
+     lambda n, kind, seed: (importlib.import_module("IterativeAlgorithmn").SearchIndex(generate_input(kind, n, seed)),
+                            generate_input(kind, n, seed + 1))),
+    ("DivideandConquer", "binary_search", ARRAY_SIZES, ["random"], SORTED_WITH_TARGET),
+    ("DivideandConquer", "merge_sort", ARRAY_SIZES, INPUT_KINDS, ARRAY),
+    ("DivideandConquer", "quick_sort", QUADRATIC_SIZES, INPUT_KINDS, ARRAY),
+    ("DivideandConquer", "hybrid_quick_sort", ARRAY_SIZES, INPUT_KINDS, ARRAY),
+    ("LinearSorting", "counting_sort", ARRAY_SIZES, INPUT_KINDS, ARRAY),
+    ("LinearSorting", "radix_sort", ARRAY_SIZES, INPUT_KINDS, ARRAY),
+    ("LinearSorting", "radix_sort_bytes", ARRAY_SIZES, INPUT_KINDS, ARRAY),
+    ("LinearSorting", "bucket_sort", ARRAY_SIZES, INPUT_KINDS, ARRAY),
+    ("SortDispatcher", "sort", ARRAY_SIZES, INPUT_KINDS, ARRAY),
+    ("RandomizedAlgorithmn", "randomized_quicksort", ARRAY_SIZES, INPUT_KINDS,
+     lambda n, kind, seed: (generate_input(kind, n, seed), 0, n - 1)),
+    ("RandomizedAlgorithmn", "build_random_bst", ARRAY_SIZES, ["random"], ARRAY),
+    ("LowerBoundTechniques", "sorting_lower_bound", [10, 100, 1000], ["random"],
+     lambda n, kind, seed: (n,)),
+    ("LowerBoundTechniques", "merge_insertion_sort", [500, 1000, 2000], INPUT_KINDS, ARRAY),
+    ("DynamicProgramming", "weighted_interval_scheduling", QUADRATIC_SIZES, ["random"],
+     lambda n, kind, seed: (_random_intervals(n, seed),)),
+    ("DynamicProgramming", "segmented_least_squares", [10, 20, 40], ["random"],
+     lambda n, kind, seed: (list(zip(range(n), generate_input(kind, n, seed))), 10)),
+    ("DynamicProgramming", "knapsack", [25, 50, 100], ["random"],
+     lambda n, kind, seed: ([w + 1 for w in generate_input(kind, n, seed, 50)],
+                            generate_input(kind, n, seed + 1, 100), 10 * n)),
+    ("DynamicProgramming", "floyd_warshall", [20, 40, 80], ["random"],
+     lambda n, kind, seed: (_random_matrix(n, seed),)),
+    ("GreedyAlgorithm", "interval_scheduling", ARRAY_SIZES, ["random"],
+     lambda n, kind, seed: ([(s, s + 10) for s in generate_input(kind, n, seed)],)),
+    ("GreedyAlgorithm", "prim_mst", ARRAY_SIZES, ["random"],
+     lambda n, kind, seed: (_random_graph(n, seed)[0],)),
+    ("GreedyAlgorithm", "kruskal_mst", ARRAY_SIZES, ["random"],
+     lambda n, kind, seed: (n, _random_graph(n, seed)[1])),
+    ("GreedyAlgorithm", "dijkstra", ARRAY_SIZES, ["random"],
+     lambda n, kind, seed: (_random_graph(n, seed)[0], 0)),
+    ("StringProcess", "finite_automata_matcher", ARRAY_SIZES, ["random"],
+     lambda n, kind, seed: (_random_text(n, seed), "abcab")),
+    ("StringProcess", "kmp_search", ARRAY_SIZES, ["random"],
+     lambda n, kind, seed: (_random_text(n, seed), "abcab")),
+    ("StringProcess", "aho_corasick_search", ARRAY_SIZES, ["random"],
+     lambda n, kind, seed: (_random_text(n, seed), ["abcab", "dd", "bca", "aaaa"])),
+    ("StringProcess", "SuffixArrayIndex", ARRAY_SIZES, ["random"],
+     lambda n, kind, seed: (_random_text(n, seed),)),
+    ("ComplexityClasses", "binary_search", ARRAY_SIZES, ["random"], SORTED_WITH_TARGET),
+    ("ComplexityClasses", "subset_sum", [8, 12, 16], ["random"],
+     lambda n, kind, seed: (generate_input(kind, n, seed, 1000), -1)),
+    ("ComplexityClasses", "brute_force_3sat", [6, 9, 12], ["random"],
+     lambda n, kind, seed: ([[f"x{i}", f"~x{(i + 1) % n}", f"x{(i + 2) % n}"] for i in range(n)]
+                            + [[f"~x{i}"] for i in range(n)], [f"x{i}" for i in range(n)])),
+    ("ComplexityClasses", "tsp_brute_force", [5, 6, 7], ["random"],
+     lambda n, kind, seed: (_random_matrix(n, seed),)),
+]
+
+# ======================
+# Measurement
+# ======================
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    k = max(0, math.ceil(pct / 100 * len(sorted_values)) - 1)
+    return sorted_values[k]
+
+def measure(func, make_args, warmup=1, repeat=5):
+    """
+    Runs func(*make_args()) warmup + repeat times, timing only the calls,
+    and returns median/p95/min/max in nanoseconds. Output printed by the
+    algorithm is discarded.
+    """
+    samples = []
+    with redirect_stdout(io.StringIO()):
+        for run in range(warmup + repeat):
+            args = make_args()
+            start = time.perf_counter_ns()
+            func(*args)
+            elapsed = time.perf_counter_ns() - start
+            if run >= warmup:
+                samples.append(elapsed)
+    samples.sort()
+    return {"median_ns": percentile(samples, 50), "p95_ns": percentile(samples, 95),
+            "min_ns": samples[0], "max_ns": samples[-1], "repeat": repeat}
+
+# ======================
+# Memory Profiling (tracemalloc + RSS sampling)
+# ======================
+RSS_SAMPLE_INTERVAL = 0.005
+
+def current_rss():
+    """Resident set size in bytes, or None where it cannot be read"""
+    try:
+        # unbuffered read: no 8 KiB buffer that would show up in tracemalloc
+        with open("/proc/self/statm", "rb", buffering=0) as f:
+            return int(f.read(64).split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        if resource is not None:  # high-water mark only; KB on Linux, bytes on macOS
+            scale = 1 if sys.platform == "darwin" else 1024
+            return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+        return None
+
+class RssSampler:
+    """
+    Context manager sampling process RSS on a background thread.
+    peak_bytes is the highest sampled RSS above the RSS at entry
+    (None where RSS cannot be read).
+    """
+    def __init__(self, sample_interval=RSS_SAMPLE_INTERVAL):
+        self.sample_interval = sample_interval
+        self.peak_bytes = None
+
+    def _sample(self):
+        while not self._stop.wait(self.sample_interval):
+            rss = current_rss()
+            if rss is not None:
+                self._max = max(self._max, rss)
+
+    def __enter__(self):
+        self._start = current_rss()
+        self._max = self._start or 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        end = current_rss()
+        if self._start is not None and end is not None:
+            self.peak_bytes = max(self._max, end) - self._start
+        return False
+
+class MemoryTracker:
+    """
+    Context manager reporting Python heap usage (tracemalloc) and process
+    RSS for the enclosed block:
+        peak_bytes     highest traced allocation above the starting level
+        net_bytes      traced bytes still allocated at exit (retained)
+        rss_peak_bytes highest sampled RSS above the starting RSS
+    tracemalloc only exposes current and peak sizes, not a running sum of
+    every allocation, so peak_bytes is the allocation figure to compare.
+    """
+    _active = []  # open trackers, outermost first
+
+    def __init__(self, sample_interval=RSS_SAMPLE_INTERVAL):
+        self.sample_interval = sample_interval
+        self.peak_bytes = self.net_bytes = self.rss_peak_bytes = None
+
+    def __enter__(self):
+        # Start the sampler before taking the baseline so its own thread
+        # objects are not counted against the block
+        self._rss = RssSampler(self.sample_interval)
+        self._rss.__enter__()
+        self._started = not tracemalloc.is_tracing()
+        if self._started:
+            tracemalloc.start()
+        # reset_peak() below wipes the peak an enclosing tracker is waiting
+        # for, so remember it and hand it back on exit
+        MemoryTracker._active.append(self)
+        self._inner_peak = 0
+        self._base, self._outer_peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        return self
+
+    def __exit__(self, *exc):
+        current, peak = tracemalloc.get_traced_memory()
+        peak = max(peak, self._inner_peak)
+        MemoryTracker._active.remove(self)
+        if MemoryTracker._active:
+            outer = MemoryTracker._active[-1]
+            outer._inner_peak = max(outer._inner_peak, self._outer_peak, peak)
+        if self._started:
+            tracemalloc.stop()
+        self._rss.__exit__(*exc)
+        self.peak_bytes = peak - self._base
+        self.net_bytes = current - self._base
+        self.rss_peak_bytes = self._rss.peak_bytes
+        return False
+
+    def report(self):
+        return {"peak_bytes": self.peak_bytes, "net_bytes": self.net_bytes,
+                "rss_peak_bytes": self.rss_peak_bytes}
+
+def profile_memory(func):
+    """Decorator: prints the memory report of each call, keeps it in .last_memory"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with MemoryTracker() as tracker:
+            result = func(*args, **kwargs)
+        wrapper.last_memory = tracker.report()
+        print(f"{func.__name__} peak {tracker.peak_bytes / 1024:.1f} KiB, "
+              f"retained {tracker.net_bytes / 1024:.1f} KiB")
+        return result
+    wrapper.last_memory = None
+    return wrapper
+
+def measure_memory(func, make_args):
+    """Memory report for one call of func(*make_args()); inputs are built outside"""
+    args = make_args()
+    with redirect_stdout(io.StringIO()), MemoryTracker() as tracker:
+        func(*args)
+    return tracker.report()
+
+def _git_commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, timeout=10)
+        return out.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+def run_suite(cases=CASES, name_filter=None, warmup=1, repeat=5, quick=False, seed=0, memory=False):
+    """
+    Times every registered case over its sizes and input kinds; with
+    memory=True each case also gets one traced run for its memory report.
+    Modules whose optional dependencies are missing are skipped and listed.
+    """
+    results, skipped = [], []
+    for module_name, func_name, sizes, kinds, build in cases:
+        name = f"{module_name}.{func_name}"
+        if name_filter and name_filter not in name:
+            continue
+        try:
+            func = functools.reduce(getattr, func_name.split("."), importlib.import_module(module_name))
+        except ImportError as exc:
+            skipped.append({"name": name, "reason": str(exc)})
+            continue
+        for n in (sizes[:1] if quick else sizes):
+            for kind in kinds:
+                stats = measure(func, lambda: build(n, kind, seed), warmup, repeat)
+                line = (f"{name:<48} {kind:<10} n = {n:>6}  "
+                        f"median = {stats['median_ns'] / 1e6:9.3f}ms  p95 = {stats['p95_ns'] / 1e6:9.3f}ms")
+                if memory:
+                    stats.update(measure_memory(func, lambda: build(n, kind, seed)))
+                    line += f"  peak = {stats['peak_bytes'] / 1024:9.1f}KiB"
+                results.append({"name": name, "kind": kind, "n": n, **stats})
+                print(line)
+    meta = {"python": platform.python_version(), "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"), "commit": _git_commit(),
+            "warmup": warmup, "repeat": repeat}
+    return {"meta": meta, "results": results, "skipped": skipped}
+
+# ======================
+# JSON Results and Regression Check
+# ======================
+def save_results(report, path):
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+
+def load_results(path):
+    with open(path) as f:
+        return json.load(f)
+
+def compare_results(baseline, current, threshold=1.25):
+    """
+    Cases whose median got slower than threshold x the baseline median.
+    Returns a list of (name, kind, n, baseline_ns, current_ns, ratio).
+    """
+    before = {(r["name"], r["kind"], r["n"]): r["median_ns"] for r in baseline["results"]}
+    regressions = []
+    for r in current["results"]:
+        key = (r["name"], r["kind"], r["n"])
+        if key in before and before[key] > 0:
+            ratio = r["median_ns"] / before[key]
+            if ratio > threshold:
+                regressions.append((*key, before[key], r["median_ns"], ratio))
+    return regressions
+
+# ======================
+# Proof of Correctness
+# ======================
+def test_correctness():
+    print("\n=== Proof of Correctness ===")
+    values = [15, 20, 35, 40, 50]
+    assert [percentile(values, p) for p in (5, 30, 40, 50, 95, 100)] == [15, 20, 20, 35, 50, 50]
+
+    def report(*medians):
+        return {"results": [{"name": "mod.sort", "kind": kind, "n": 100, "median_ns": ns}
+                            for kind, ns in zip(["sorted", "random"], medians)]}
+    regressions = compare_results(report(1000, 1000), report(1200, 1500), threshold=1.25)
+    assert regressions == [("mod.sort", "random", 100, 1000, 1500, 1.5)]
+    assert compare_results(report(1000, 1000), report(1240, 900), threshold=1.25) == []
+
+    with redirect_stdout(io.StringIO()):
+        suite = run_suite(name_filter="IterativeAlgorithmn.linear_search", warmup=0, repeat=2, quick=True)
+    assert [(r["name"], r["n"]) for r in suite["results"]] == [("IterativeAlgorithmn.linear_search", ARRAY_SIZES[0])]
+    assert suite["results"][0]["min_ns"] <= suite["results"][0]["median_ns"] <= suite["results"][0]["max_ns"]
+    print("✅ Benchmark Suite passed")
+
+    with MemoryTracker() as empty:
+        pass
+    assert empty.peak_bytes == 0 and empty.net_bytes == 0
+
+    size = 1 << 20
+    with MemoryTracker() as tracker:
+        block = bytearray(size)
+    assert tracker.peak_bytes >= size and tracker.net_bytes >= size
+    del block
+
+    @profile_memory
+    def allocate(n):
+        return len(bytearray(n))
+
+    with redirect_stdout(io.StringIO()), MemoryTracker() as outer:
+        block = bytearray(8 * size)
+        del block
+        allocate(size)
+    assert outer.peak_bytes >= 8 * size  # the inner tracker keeps the outer peak
+    assert size <= allocate.last_memory["peak_bytes"] < 8 * size
+    assert measure_memory(bytearray, lambda: (size,))["peak_bytes"] >= size
+    with RssSampler() as rss:
+        pass
+    assert rss.peak_bytes is None or rss.peak_bytes >= 0
+    print("✅ Memory Profiling passed")
+
+# ======================
+# Main Function
+# ======================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark every algorithm unit")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--compare", help="baseline JSON to check for regressions")
+    parser.add_argument("--filter", help="only run cases whose name contains this")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--threshold", type=float, default=1.25)
+    parser.add_argument("--quick", action="store_true", help="smallest size only")
+    parser.add_argument("--memory", action="store_true", help="also report peak memory")
+    parser.add_argument("--test", action="store_true", help="run the self-checks and exit")
+    args = parser.parse_args(argv)
+    if args.test:
+        test_correctness()
+        return 0
+
+    print("=== Benchmark Suite ===\n")
+    report = run_suite(name_filter=args.filter, warmup=args.warmup,
+                       repeat=args.repeat, quick=args.quick, memory=args.memory)
+    for skip in report["skipped"]:
+        print(f"skipped {skip['name']}: {skip['reason']}")
+    if args.output:
+        save_results(report, args.output)
+        print(f"\nResults written to {args.output}")
+    if args.compare:
+        regressions = compare_results(load_results(args.compare), report, args.threshold)
+        for name, kind, n, old, new, ratio in regressions:
+            print(f"REGRESSION {name} {kind} n = {n}: {old / 1e6:.3f}ms -> {new / 1e6:.3f}ms ({ratio:.2f}x)")
+        if regressions:
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
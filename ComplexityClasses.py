@@ -1,6 +1,14 @@
 # Unit-XI Introduction to Complexity Classes: P, NP, NP-Hard, NP-Complete.
 
+import os
+import json
+import math
+import hashlib
+import tempfile
 from itertools import combinations, permutations
+from concurrent.futures import ProcessPoolExecutor
+from IterativeAlgorithmn import batch_contains
+from LowerBoundTechniques import permutations_range, permutation_shards
 
 # ===============================
 # 1. P Class Example: Binary Search
@@ -17,6 +25,10 @@ def binary_search(arr, x):
             high = mid - 1
     return False
 
+def batch_binary_search(arr, xs):
+    """Membership of many keys in one call: [binary_search(arr, x) for x in xs]"""
+    return batch_contains(arr, xs)
+
 # ===============================
 # 2. NP Class Example: Subset Sum
 # ===============================
@@ -69,6 +81,72 @@ def tsp_brute_force(graph):
             best_path = path
     return min_cost, best_path
 
+def tsp_brute_force_range(graph, start, stop):
+    """
+    Same search as tsp_brute_force, restricted to the tours whose
+    permutation of 1..n-1 has a rank in [start, stop).
+    Returns (min_cost, best_path, best_rank); best_rank breaks ties the way
+    the sequential loop does (first tour found wins).
+    """
+    n = len(graph)
+    min_cost = float('inf')
+    best_path, best_rank = [], None
+
+    for rank, perm in enumerate(permutations_range(range(1, n), start, stop), start):
+        path = [0] + list(perm) + [0]
+        cost = sum(graph[path[i]][path[i+1]] for i in range(n))
+        if cost < min_cost:
+            min_cost, best_path, best_rank = cost, path, rank
+    return min_cost, best_path, best_rank
+
+def _tsp_shard(args):
+    return tsp_brute_force_range(*args)
+
+def tsp_brute_force_parallel(graph, workers=None):
+    """Splits the (n-1)! tours into equal rank shards across a process pool"""
+    workers = workers or os.cpu_count() or 1
+    shards = permutation_shards(len(graph) - 1, workers)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(_tsp_shard, [(graph, a, b) for a, b in shards]))
+    cost, path, _ = min(results, key=lambda r: (r[0], r[2] if r[2] is not None else math.inf))
+    return cost, path
+
+def _graph_fingerprint(graph):
+    """Size plus a hash of the distance matrix, stored with a checkpoint"""
+    digest = hashlib.sha256(json.dumps(graph).encode()).hexdigest()
+    return {"n": len(graph), "sha256": digest}
+
+def tsp_brute_force_resumable(graph, checkpoint_path, chunk=100000):
+    """
+    tsp_brute_force that saves {graph fingerprint, next_rank, best} to
+    checkpoint_path after every chunk of tours, and picks up from there
+    when restarted. A checkpoint written for another graph raises
+    ValueError; the file is removed once the search completes.
+    """
+    total = math.factorial(len(graph) - 1)
+    fingerprint = _graph_fingerprint(graph)
+    state = {"graph": fingerprint, "next_rank": 0, "min_cost": None, "best_path": [], "best_rank": None}
+    if os.path.exists(checkpoint_path):
+        with open(checkpoint_path) as f:
+            state = json.load(f)
+        if state.get("graph") != fingerprint:
+            raise ValueError(f"{checkpoint_path} was written for a different graph")
+
+    while state["next_rank"] < total:
+        start = state["next_rank"]
+        stop = min(total, start + chunk)
+        cost, path, rank = tsp_brute_force_range(graph, start, stop)
+        if state["min_cost"] is None or cost < state["min_cost"]:
+            state.update(min_cost=cost, best_path=path, best_rank=rank)
+        state["next_rank"] = stop
+        with open(checkpoint_path + ".tmp", "w") as f:
+            json.dump(state, f)
+        os.replace(checkpoint_path + ".tmp", checkpoint_path)
+    if os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    cost = state["min_cost"] if state["min_cost"] is not None else float('inf')
+    return cost, state["best_path"]
+
 # ===============================
 # Test All
 # ===============================
@@ -79,7 +157,10 @@ def test_all():
     print("P Class (Binary Search):")
     arr = [1, 2, 3, 4, 5, 6]
     print(f"Search 4: {binary_search(arr, 4)}")
-    print(f"Search 9: {binary_search(arr, 9)}\n")
+    print(f"Search 9: {binary_search(arr, 9)}")
+    print(f"Batch search [4, 9, 1]: {batch_binary_search(arr, [4, 9, 1])}\n")
+    assert batch_binary_search(arr, [4, 9, 1]) == [True, False, True]
+    assert batch_binary_search([(1, 2), (3, 4)], [(3, 4)]) == [True]
 
     # NP Class
     print("NP Class (Subset Sum):")
@@ -105,5 +186,26 @@ def test_all():
     print(f"Min TSP Cost: {cost}")
     print(f"Path: {path}")
 
+    assert tsp_brute_force_parallel(graph, 3) == (cost, path)
+    with tempfile.TemporaryDirectory() as tmp:
+        checkpoint = os.path.join(tmp, "tsp.json")
+        # simulate a crash after the first chunk, then resume
+        first = tsp_brute_force_range(graph, 0, 2)
+        with open(checkpoint, "w") as f:
+            json.dump({"graph": _graph_fingerprint(graph), "next_rank": 2,
+                       "min_cost": first[0], "best_path": first[1], "best_rank": first[2]}, f)
+        assert tsp_brute_force_resumable(graph, checkpoint, chunk=1) == (cost, path)
+        assert not os.path.exists(checkpoint)
+        # a leftover checkpoint from another graph is rejected, not reused
+        with open(checkpoint, "w") as f:
+            json.dump({"graph": _graph_fingerprint([[0, 1], [1, 0]]), "next_rank": 6,
+                       "min_cost": 2, "best_path": [0, 1, 0], "best_rank": 0}, f)
+        try:
+            tsp_brute_force_resumable(graph, checkpoint)
+            assert False, "expected ValueError"
+        except ValueError:
+            pass
+    print("Sharded and resumed TSP agree with the sequential search")
+
 if __name__ == "__main__":
     test_all()
@@ -1,8 +1,21 @@
 # Unit-III Divide and Conquer: Recurrence Relation, Master’s Theorem, Recursion Trees; Binary Search, Merge sort and Quick sort – time complexity and proof of correctness.
 
+import os
+import sys
+import json
 import time
+import heapq
+import bisect
 import random
 import math
+import tempfile
+from array import array
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from IterativeAlgorithmn import insertion_sort
+from BenchmarkSuite import test_time, RssSampler
 
 # ======================
 # Recurrence Helper (Master Theorem Application)
@@ -24,13 +37,132 @@ def master_theorem(a, b, f_n):
     return f"Compare f(n) to n^{log_b_a():.2f} to determine the case."
 
 
+# ======================
+# Instrumentation (disabled by default)
+# ======================
+class Tracer:
+    """
+    Base sink: every hook is a no-op. The algorithms only call hooks when a
+    tracer is installed, so with tracing off the cost is one `is None` check
+    per call. Counts are passed in already computed (e.g. comparisons made by
+    a merge), so the hot loops carry no counters.
+    """
+    def on_search(self, arr, left, right, depth):
+        pass
+
+    def on_divide(self, arr, depth):
+        pass
+
+    def on_merge(self, left, right, comparisons, moves, depth):
+        pass
+
+    def on_partition(self, arr, low, high, pivot, depth):
+        pass
+
+    def on_swaps(self, swaps, depth):
+        pass
+
+class ConsoleTracer(Tracer):
+    """The classic textual trace"""
+    def on_search(self, arr, left, right, depth):
+        print("  " * depth + f"Searching in {arr[left:right+1]}")
+
+    def on_divide(self, arr, depth):
+        print("  " * depth + f"Dividing: {arr}")
+
+    def on_merge(self, left, right, comparisons, moves, depth):
+        print(f"Merging: {left} + {right}")
+
+    def on_partition(self, arr, low, high, pivot, depth):
+        print("  " * depth + f"Partitioning: {arr[low:high+1]}, Pivot={pivot}")
+
+class CounterTracer(Tracer):
+    """In-memory operation counters plus the recursion tree as (depth, op, size)"""
+    def __init__(self):
+        self.comparisons = 0
+        self.swaps = 0
+        self.moves = 0
+        self.max_depth = 0
+        self.tree = []
+
+    def _node(self, op, size, depth):
+        self.max_depth = max(self.max_depth, depth)
+        self.tree.append((depth, op, size))
+
+    def on_search(self, arr, left, right, depth):
+        self._node("search", max(0, right - left + 1), depth)
+        if left <= right:
+            self.comparisons += 1
+
+    def on_divide(self, arr, depth):
+        self._node("divide", len(arr), depth)
+
+    def on_merge(self, left, right, comparisons, moves, depth):
+        self._node("merge", len(left) + len(right), depth)
+        self.comparisons += comparisons
+        self.moves += moves
+
+    def on_partition(self, arr, low, high, pivot, depth):
+        self._node("partition", high - low + 1, depth)
+        self.comparisons += high - low
+
+    def on_swaps(self, swaps, depth):
+        self.swaps += swaps
+
+    def summary(self):
+        return {"comparisons": self.comparisons, "swaps": self.swaps,
+                "moves": self.moves, "max_depth": self.max_depth,
+                "nodes": len(self.tree)}
+
+class JsonLinesTracer(Tracer):
+    """One JSON object per event; arrays are reported by size only"""
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout
+
+    def _write(self, **record):
+        self.stream.write(json.dumps(record) + "\n")
+
+    def on_search(self, arr, left, right, depth):
+        self._write(event="search", depth=depth, left=left, right=right)
+
+    def on_divide(self, arr, depth):
+        self._write(event="divide", depth=depth, size=len(arr))
+
+    def on_merge(self, left, right, comparisons, moves, depth):
+        self._write(event="merge", depth=depth, left=len(left), right=len(right),
+                    comparisons=comparisons, moves=moves)
+
+    def on_partition(self, arr, low, high, pivot, depth):
+        self._write(event="partition", depth=depth, low=low, high=high,
+                    comparisons=high - low)
+
+    def on_swaps(self, swaps, depth):
+        self._write(event="swaps", depth=depth, swaps=swaps)
+
+_tracer = None
+
+def set_tracer(tracer):
+    """Installs a tracer (None disables tracing) and returns the previous one"""
+    global _tracer
+    previous, _tracer = _tracer, tracer
+    return previous
+
+@contextmanager
+def tracing(tracer):
+    previous = set_tracer(tracer)
+    try:
+        yield tracer
+    finally:
+        set_tracer(previous)
+
 # ======================
 # Binary Search (Recursive)
 # ======================
 def binary_search(arr, target, left=0, right=None, depth=0):
     if right is None:
         right = len(arr) - 1
-    print("  " * depth + f"Searching in {arr[left:right+1]}")
+    if _tracer is not None:
+        _tracer.on_search(arr, left, right, depth)
 
     if left <= right:
         mid = (left + right) // 2
@@ -49,28 +181,217 @@ def merge_sort(arr, depth=0):
     if len(arr) <= 1:
         return arr
 
-    print("  " * depth + f"Dividing: {arr}")
+    if _tracer is not None:
+        _tracer.on_divide(arr, depth)
     mid = len(arr) // 2
     left = merge_sort(arr[:mid], depth + 1)
     right = merge_sort(arr[mid:], depth + 1)
 
-    return merge(left, right)
+    return merge(left, right, depth)
 
-def merge(left, right):
+def merge(left, right, depth=0):
     result = []
     i = j = 0
-    print(f"Merging: {left} + {right}")
     while i < len(left) and j < len(right):
-        if left[i] < right[j]:
+        if left[i] <= right[j]:  # ties take left first, keeping the sort stable
             result.append(left[i])
             i += 1
         else:
             result.append(right[j])
             j += 1
+    if _tracer is not None:
+        # one comparison per element placed by the loop
+        _tracer.on_merge(left, right, i + j, len(left) + len(right), depth)
     result.extend(left[i:])
     result.extend(right[j:])
     return result
 
+# ======================
+# Parallel Merge Sort (process pool + k-way merge)
+# ======================
+INT64_MIN, INT64_MAX = -(1 << 63), (1 << 63) - 1
+
+def kway_merge(runs):
+    """
+    Heap-based merge of k sorted runs. Ties are broken by run index, so like
+    merge() an element from an earlier run always comes out first (stable).
+    """
+    heap = [(run[0], r, 0) for r, run in enumerate(runs) if run]
+    heapq.heapify(heap)
+    result = []
+    while heap:
+        value, r, idx = heap[0]
+        result.append(value)
+        idx += 1
+        if idx < len(runs[r]):
+            heapq.heapreplace(heap, (runs[r][idx], r, idx))
+        else:
+            heapq.heappop(heap)
+    return result
+
+def _numeric_typecode(arr):
+    """'q' or 'd' when arr can live in a shared array buffer, else None"""
+    if all(type(x) is int for x in arr):
+        if INT64_MIN <= min(arr) and max(arr) <= INT64_MAX:
+            return 'q'
+    elif all(type(x) is float for x in arr):
+        return 'd'
+    return None
+
+def _sort_chunk(chunk):
+    return merge_sort(chunk)
+
+def _sort_shared_chunk(args):
+    name, typecode, start, end = args
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        view = shm.buf.cast(typecode)
+        view[start:end] = array(typecode, merge_sort(view[start:end].tolist()))
+        view.release()
+    finally:
+        shm.close()
+
+def parallel_merge_sort(arr, workers=None):
+    """
+    Sorts chunks of arr in a process pool and combines the runs with kway_merge.
+    Int64/float arrays are shared through multiprocessing.shared_memory so the
+    data is not pickled to the workers; anything else is sent chunk by chunk.
+    """
+    workers = workers or os.cpu_count() or 1
+    n = len(arr)
+    if workers == 1 or n <= 1:
+        return merge_sort(list(arr))
+
+    size = -(-n // workers)
+    bounds = [(start, min(n, start + size)) for start in range(0, n, size)]
+    typecode = _numeric_typecode(arr)
+
+    if typecode is None:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            runs = list(pool.map(_sort_chunk, [arr[start:end] for start, end in bounds]))
+        return kway_merge(runs)
+
+    data = array(typecode, arr)
+    shm = shared_memory.SharedMemory(create=True, size=len(data) * data.itemsize)
+    try:
+        view = shm.buf.cast(typecode)
+        view[:len(data)] = data  # the block may be rounded up to a whole page
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(_sort_shared_chunk, [(shm.name, typecode, start, end)
+                                               for start, end in bounds]))
+        runs = [view[start:end].tolist() for start, end in bounds]
+        view.release()
+    finally:
+        shm.close()
+        shm.unlink()
+    return kway_merge(runs)
+
+def benchmark_parallel_merge_sort(n=10_000_000, max_workers=None):
+    """Speedup curve of parallel_merge_sort for 1..max_workers processes"""
+    max_workers = max_workers or os.cpu_count() or 1
+    data = [random.randint(0, n) for _ in range(n)]
+    baseline = None
+    for workers in range(1, max_workers + 1):
+        start = time.time()
+        parallel_merge_sort(data, workers)
+        elapsed = time.time() - start
+        baseline = baseline or elapsed
+        print(f"workers = {workers:>2}, n = {n}, Time taken = {elapsed:.6f}s, "
+              f"speedup = {baseline / elapsed if elapsed else float('inf'):.2f}x")
+
+# ======================
+# External Merge Sort (data larger than RAM)
+# ======================
+# Rough in-memory cost of one record, used to turn a byte budget into a run size
+RECORD_OVERHEAD = {"int64": 40, "text": 60}
+
+def _read_blocks(f, fmt, block_records):
+    """Yields lists of at most block_records records: int64 (native) or text lines"""
+    if fmt == "int64":
+        while True:
+            raw = f.read(block_records * 8)
+            if not raw:
+                return
+            block = array('q')
+            block.frombytes(raw)
+            yield block.tolist()
+    else:
+        block = []
+        for line in f:
+            block.append(line.rstrip(b"\n"))
+            if len(block) == block_records:
+                yield block
+                block = []
+        if block:
+            yield block
+
+def _write_block(f, fmt, block):
+    data = array('q', block).tobytes() if fmt == "int64" else b"".join(r + b"\n" for r in block)
+    f.write(data)
+    return len(data)
+
+def _counted(blocks, fmt, stats):
+    for block in blocks:
+        stats["bytes_read"] += len(block) * 8 if fmt == "int64" else sum(len(r) + 1 for r in block)
+        yield block
+
+def _merge_block_streams(left, right):
+    """
+    Streams merge() over two block iterators with bounded buffers. Each step
+    merges only the records <= the smaller of the two buffered maxima, which
+    are all safe to emit; the rest waits for the next block.
+    """
+    lbuf, rbuf = next(left, []), next(right, [])
+    while lbuf and rbuf:
+        bound = min(lbuf[-1], rbuf[-1])
+        a, b = bisect.bisect_right(lbuf, bound), bisect.bisect_right(rbuf, bound)
+        yield merge(lbuf[:a], rbuf[:b])
+        lbuf, rbuf = lbuf[a:] or next(left, []), rbuf[b:] or next(right, [])
+    rest, stream = (lbuf, left) if lbuf else (rbuf, right)
+    if rest:
+        yield rest
+    yield from stream
+
+def external_sort(in_path, out_path, fmt="int64", memory_budget=64 << 20, tmp_dir=None):
+    """
+    Sorts a file of native int64 values (fmt="int64") or newline-delimited
+    text (fmt="text") using at most about memory_budget bytes of records.
+    Sorted runs go to temporary files and are merged with a tree of bounded
+    buffer merges. Returns runs, records, I/O bytes and the peak RSS growth
+    sampled during the sort.
+    """
+    run_records = max(2, memory_budget // RECORD_OVERHEAD[fmt])
+    stats = {"runs": 0, "records": 0, "bytes_read": 0, "bytes_written": 0}
+    runs = []
+
+    with RssSampler() as rss:
+        try:
+            with open(in_path, "rb") as f:
+                for block in _counted(_read_blocks(f, fmt, run_records), fmt, stats):
+                    run = tempfile.TemporaryFile(dir=tmp_dir)
+                    stats["bytes_written"] += _write_block(run, fmt, merge_sort(block))
+                    stats["records"] += len(block)
+                    run.seek(0)
+                    runs.append(run)
+            stats["runs"] = len(runs)
+
+            # Each run and each merge node buffers a share of the budget
+            block_records = max(1, run_records // (3 * max(1, len(runs))))
+            streams = [_counted(_read_blocks(run, fmt, block_records), fmt, stats) for run in runs]
+            while len(streams) > 1:
+                paired = [_merge_block_streams(streams[i], streams[i + 1])
+                          for i in range(0, len(streams) - 1, 2)]
+                streams = paired + streams[len(streams) - len(streams) % 2:]
+
+            with open(out_path, "wb") as out:
+                for block in (streams[0] if streams else []):
+                    stats["bytes_written"] += _write_block(out, fmt, block)
+        finally:
+            for run in runs:
+                run.close()
+    stats["rss_peak_bytes"] = rss.peak_bytes
+    return stats
+
 # ======================
 # Quick Sort
 # ======================
@@ -86,23 +407,107 @@ def quick_sort(arr, low=0, high=None, depth=0):
 def partition(arr, low, high, depth):
     pivot = arr[high]
     i = low - 1
-    print("  " * depth + f"Partitioning: {arr[low:high+1]}, Pivot={pivot}")
+    if _tracer is not None:
+        _tracer.on_partition(arr, low, high, pivot, depth)
     for j in range(low, high):
         if arr[j] <= pivot:
             i += 1
             arr[i], arr[j] = arr[j], arr[i]
     arr[i + 1], arr[high] = arr[high], arr[i + 1]
+    if _tracer is not None:
+        _tracer.on_swaps(i - low + 2, depth)
     return i + 1
 
 # ======================
-# Time Complexity Tester
+# Hybrid Quick Sort (Introsort)
 # ======================
-def test_time(func, *args):
-    start = time.time()
-    result = func(*args)
-    end = time.time()
-    print(f"{func.__name__} executed in {(end - start):.6f}s")
-    return result
+INSERTION_THRESHOLD = 16
+NINTHER_THRESHOLD = 40
+
+def _median_of_three(arr, a, b, c):
+    x, y, z = arr[a], arr[b], arr[c]
+    if x < y:
+        return y if y < z else (z if x < z else x)
+    return x if x < z else (z if y < z else y)
+
+def choose_pivot(arr, low, high):
+    """Median of three for small ranges, Tukey's ninther for larger ones"""
+    mid = (low + high) // 2
+    if high - low + 1 < NINTHER_THRESHOLD:
+        return _median_of_three(arr, low, mid, high)
+    step = (high - low + 1) // 8
+    return _median_of_three(
+        [_median_of_three(arr, low, low + step, low + 2 * step),
+         _median_of_three(arr, mid - step, mid, mid + step),
+         _median_of_three(arr, high - 2 * step, high - step, high)], 0, 1, 2)
+
+def three_way_partition(arr, low, high, pivot):
+    """
+    Dutch national flag partition around pivot. Returns (lt, gt) such that
+    arr[low:lt] < pivot, arr[lt:gt+1] == pivot and arr[gt+1:high+1] > pivot.
+    """
+    lt, i, gt = low, low, high
+    while i <= gt:
+        if arr[i] < pivot:
+            arr[lt], arr[i] = arr[i], arr[lt]
+            lt += 1
+            i += 1
+        elif pivot < arr[i]:
+            arr[i], arr[gt] = arr[gt], arr[i]
+            gt -= 1
+        else:
+            i += 1
+    return lt, gt
+
+def heap_sort_range(arr, low, high):
+    """In-place heapsort of arr[low:high+1]"""
+    n = high - low + 1
+
+    def sift_down(root, end):
+        while 2 * root + 1 < end:
+            child = 2 * root + 1
+            if child + 1 < end and arr[low + child] < arr[low + child + 1]:
+                child += 1
+            if not arr[low + root] < arr[low + child]:
+                return
+            arr[low + root], arr[low + child] = arr[low + child], arr[low + root]
+            root = child
+
+    for start in range(n // 2 - 1, -1, -1):
+        sift_down(start, n)
+    for end in range(n - 1, 0, -1):
+        arr[low], arr[low + end] = arr[low + end], arr[low]
+        sift_down(0, end)
+    return arr
+
+def _introsort(arr, low, high, depth_limit):
+    while high - low + 1 > INSERTION_THRESHOLD:
+        if depth_limit == 0:
+            heap_sort_range(arr, low, high)
+            return
+        depth_limit -= 1
+        lt, gt = three_way_partition(arr, low, high, choose_pivot(arr, low, high))
+        # Recurse on the smaller side, loop on the larger: stack depth <= log2(n)
+        if lt - low < high - gt:
+            _introsort(arr, low, lt - 1, depth_limit)
+            low = gt + 1
+        else:
+            _introsort(arr, gt + 1, high, depth_limit)
+            high = lt - 1
+    if low < high:
+        arr[low:high + 1] = insertion_sort(arr[low:high + 1])
+
+def hybrid_quick_sort(arr, low=0, high=None):
+    """
+    Quick sort that cannot go quadratic or hit the recursion limit:
+    ninther pivots, three-way partition for duplicates, insertion sort for
+    small ranges and heapsort once the depth exceeds 2 * log2(n).
+    """
+    if high is None:
+        high = len(arr) - 1
+    if low < high:
+        _introsort(arr, low, high, 2 * (high - low + 1).bit_length())
+    return arr
 
 # ======================
 # Proof of Correctness
@@ -118,10 +523,68 @@ def test_correctness():
     assert quick_sort(arr.copy()) == sorted_arr
     print("✅ Quick Sort passed")
 
+    for case in (arr, [], [1], list(range(5000)), list(range(5000, 0, -1)), [7] * 5000,
+                 [random.randint(0, 5) for _ in range(3000)],
+                 [random.random() for _ in range(3000)]):
+        assert hybrid_quick_sort(case.copy()) == sorted(case)
+    partial = [9, 8, 7, 6, 5, 4, 3, 2, 1]
+    assert hybrid_quick_sort(partial, 2, 6) == [9, 8, 3, 4, 5, 6, 7, 2, 1]
+    assert heap_sort_range([5, 1, 4, 2, 3], 0, 4) == [1, 2, 3, 4, 5]
+    forced = [random.randint(0, 100) for _ in range(200)]
+    expected = sorted(forced)
+    _introsort(forced, 0, len(forced) - 1, 1)  # heapsort fallback after one level
+    assert forced == expected
+    print("✅ Hybrid Quick Sort passed")
+
     assert binary_search([1, 3, 5, 7, 9], 5) == 2
     assert binary_search([1, 3, 5, 7, 9], 10) == -1
     print("✅ Binary Search passed")
 
+    counters = CounterTracer()
+    with tracing(counters):
+        merge_sort([4, 3, 2, 1])
+        quick_sort([3, 1, 2])
+        binary_search([1, 3, 5, 7, 9], 5)
+    assert counters.summary() == {"comparisons": 7, "swaps": 2, "moves": 8,
+                                  "max_depth": 1, "nodes": 8}
+    assert _tracer is None
+    print("✅ Instrumentation passed")
+
+    # Stability: equal keys keep their input order
+    assert merge([1.0], [1]) == [1.0, 1] and type(merge([1.0], [1])[0]) is float
+    assert kway_merge([[1, 4], [1.0, 3], [], [2]]) == [1, 1.0, 2, 3, 4]
+    assert type(kway_merge([[1, 4], [1.0, 3]])[1]) is float
+
+    data = [random.randint(-1000, 1000) for _ in range(500)]
+    for workers in (1, 2, 3):
+        assert parallel_merge_sort(data, workers) == sorted(data)
+    floats = [random.random() for _ in range(300)]
+    assert parallel_merge_sort(floats, 2) == sorted(floats)
+    words = [random.choice("abcdef") * random.randint(1, 3) for _ in range(200)]
+    assert parallel_merge_sort(words, 3) == sorted(words)
+    print("✅ Parallel Merge Sort passed")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        src, dst = os.path.join(tmp, "in"), os.path.join(tmp, "out")
+        ints = [random.randint(-10**12, 10**12) for _ in range(5000)] + [7] * 50
+        with open(src, "wb") as f:
+            array('q', ints).tofile(f)
+        stats = external_sort(src, dst, "int64", memory_budget=300 * 40)
+        result = array('q')
+        with open(dst, "rb") as f:
+            result.frombytes(f.read())
+        assert result.tolist() == sorted(ints)
+        assert stats["runs"] == 17 and stats["records"] == len(ints)
+        assert stats["rss_peak_bytes"] is None or stats["rss_peak_bytes"] >= 0
+
+        lines = [f"{random.choice(['alpha', 'beta', 'gamma'])}-{random.randint(0, 99)}" for _ in range(1000)]
+        with open(src, "w") as f:
+            f.write("\n".join(lines))
+        external_sort(src, dst, "text", memory_budget=100 * 60)
+        with open(dst) as f:
+            assert f.read().splitlines() == sorted(lines)
+    print("✅ External Merge Sort passed")
+
 # ======================
 # Main Function
 # ======================
@@ -135,22 +598,44 @@ def main():
 
     # Binary Search
     arr = list(range(1, 17))
-    print(">> Binary Search Trace:")
-    binary_search(arr, 9)
+    with tracing(ConsoleTracer()):
+        print(">> Binary Search Trace:")
+        binary_search(arr, 9)
 
-    # Merge Sort Trace
-    print("\n>> Merge Sort Trace:")
-    merge_sort([38, 27, 43, 3, 9, 82, 10])
+        # Merge Sort Trace
+        print("\n>> Merge Sort Trace:")
+        merge_sort([38, 27, 43, 3, 9, 82, 10])
 
-    # Quick Sort Trace
-    print("\n>> Quick Sort Trace:")
-    quick_sort([38, 27, 43, 3, 9, 82, 10])
+        # Quick Sort Trace
+        print("\n>> Quick Sort Trace:")
+        quick_sort([38, 27, 43, 3, 9, 82, 10])
+
+    # Counters and JSON lines for the same input
+    counters = CounterTracer()
+    with tracing(counters):
+        merge_sort([38, 27, 43, 3, 9, 82, 10])
+    print(f"\n>> Merge Sort Counters: {counters.summary()}")
+    print(">> Binary Search as JSON lines:")
+    with tracing(JsonLinesTracer()):
+        binary_search(arr, 9)
 
     # Time Benchmarking
     print("\n>> Timing (Random Dataset):")
     data = [random.randint(1, 100000) for _ in range(10000)]
     test_time(merge_sort, data.copy())
     test_time(quick_sort, data.copy())
+    test_time(hybrid_quick_sort, data.copy())
+    test_time(hybrid_quick_sort, sorted(data))
+
+    print("\n>> Parallel Merge Sort Speedup (use n=10_000_000 for the full curve):")
+    benchmark_parallel_merge_sort(100000)
+
+    print("\n>> External Merge Sort (200k int64, 1 MB budget):")
+    with tempfile.TemporaryDirectory() as tmp:
+        src, dst = os.path.join(tmp, "in"), os.path.join(tmp, "out")
+        with open(src, "wb") as f:
+            array('q', [random.randint(0, 10**9) for _ in range(200000)]).tofile(f)
+        print(external_sort(src, dst, "int64", memory_budget=1 << 20))
 
     # Correctness Checks
     test_correctness()
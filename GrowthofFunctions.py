@@ -1,9 +1,30 @@
 # Unit-I Review of Growth of Functions
 
+import os
+import sys
+import json
 import time
 import math
-import matplotlib.pyplot as plt
-import numpy as np
+import tempfile
+
+from BenchmarkSuite import measure
+
+# matplotlib and NumPy are only needed for plotting, so they are imported on
+# first use; importing this module stays cheap and works without a display.
+def _numpy():
+    import numpy as np
+    return np
+
+def _pyplot(headless):
+    import matplotlib
+    if headless:
+        matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    return plt
+
+def _is_headless():
+    return sys.platform.startswith("linux") and not (
+        os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"))
 
 # Define different time complexity functions
 def constant(n):
@@ -27,30 +48,61 @@ def cubic(n):
 def exponential(n):
     return 2 ** n
 
-# Compare growth of functions visually
-def plot_growth():
-    n_values = list(range(1, 20))
-    functions = {
-        "O(1)": [constant(n) for n in n_values],
-        "O(log n)": [logarithmic(n) for n in n_values],
-        "O(n)": [linear(n) for n in n_values],
-        "O(n log n)": [linearithmic(n) for n in n_values],
-        "O(n^2)": [quadratic(n) for n in n_values],
-        "O(n^3)": [cubic(n) for n in n_values],
-        "O(2^n)": [exponential(n) for n in n_values]
+# Vectorized growth curves in log space: log10 f(n), so 2^n at n = 10^6 is
+# just 301030 instead of a 125 KB integer
+def growth_curves_log10(n_values):
+    np = _numpy()
+    n = np.asarray(n_values, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_n = np.log10(n)
+        log_ln_n = np.log10(np.log(n))  # -inf at n = 1, where log n = 0
+    return {
+        "O(1)": np.zeros_like(n),
+        "O(log n)": log_ln_n,
+        "O(n)": log_n,
+        "O(n log n)": log_n + log_ln_n,
+        "O(n^2)": 2 * log_n,
+        "O(n^3)": 3 * log_n,
+        "O(2^n)": n * math.log10(2),
     }
 
-    plt.figure(figsize=(12, 8))
+# Compare growth of functions visually
+def plot_growth(n_max=19, points=None, output=None, headless=None):
+    """
+    Plots log10 of each growth function for n in [1, n_max].
+    With output (a .png or .svg path) the figure is saved instead of shown;
+    headless defaults to True when saving or when no display is available.
+    """
+    np = _numpy()
+    if headless is None:
+        headless = output is not None or _is_headless()
+    if points is None:
+        n_values = np.arange(1, n_max + 1)
+    else:
+        n_values = np.unique(np.geomspace(1, n_max, points).round())
+    functions = growth_curves_log10(n_values)
+
+    plt = _pyplot(headless)
+    fig = plt.figure(figsize=(12, 8))
     for label, values in functions.items():
         plt.plot(n_values, values, label=label)
 
-    plt.yscale("log")  # Log scale to better compare growth
+    if n_max > 1000:
+        plt.xscale("log")
     plt.xlabel("Input size n")
-    plt.ylabel("Time / Operations")
+    plt.ylabel("log10(Time / Operations)")
     plt.title("Growth of Common Functions")
     plt.legend()
     plt.grid(True)
-    plt.show()
+    if output is not None:
+        fig.savefig(output)
+        plt.close(fig)
+        print(f"Growth plot written to {output}")
+    elif headless:
+        plt.close(fig)
+        print("No display available; pass output='growth.png' to save the plot")
+    else:
+        plt.show()
 
 # Empirical time analysis
 def empirical_analysis():
@@ -68,6 +120,85 @@ def empirical_analysis():
         end = time.time()
         print(f"n = {n:>7}, Time taken = {end - start:.6f} seconds")
 
+# Empirical complexity fitting against the catalog above
+GROWTH_MODELS = [
+    ("O(1)", constant),
+    ("O(log n)", logarithmic),
+    ("O(n)", linear),
+    ("O(n log n)", linearithmic),
+    ("O(n^2)", quadratic),
+    ("O(n^3)", cubic),
+    ("O(2^n)", exponential),
+]
+MODEL_RANK = {label: rank for rank, (label, _) in enumerate(GROWTH_MODELS)}
+
+def geometric_sizes(start, stop, factor=2):
+    """start, start*factor, ... up to stop (inclusive)"""
+    sizes = []
+    n = start
+    while n <= stop:
+        sizes.append(int(n))
+        n *= factor
+    return sizes
+
+def time_callable(func, make_input, sizes, warmup=1, repeat=3):
+    """Median time in seconds of func(make_input(n)) for each n, via BenchmarkSuite.measure"""
+    return [measure(func, lambda: (make_input(n),), warmup, repeat)["median_ns"] / 1e9
+            for n in sizes]
+
+def fit_growth(sizes, times):
+    """
+    Least-squares fit of t = c * f(n) for every growth model, done in log
+    space (log t = log c + log f(n)) so 2^n never has to become a float.
+    Returns [(label, c, r_squared)] best fit first; sizes must be >= 2.
+    """
+    log_t = [math.log(max(t, 1e-12)) for t in times]
+    mean_t = sum(log_t) / len(log_t)
+    sst = sum((y - mean_t) ** 2 for y in log_t)
+    fits = []
+    for label, func in GROWTH_MODELS:
+        log_f = [math.log(func(n)) for n in sizes]
+        log_c = sum(y - x for y, x in zip(log_t, log_f)) / len(sizes)
+        sse = sum((y - x - log_c) ** 2 for y, x in zip(log_t, log_f))
+        r2 = 1 - sse / sst if sst > 0 else (1.0 if sse == 0 else 0.0)
+        fits.append((sse, label, math.exp(log_c) if log_c < 700 else float("inf"), r2))
+    fits.sort(key=lambda fit: fit[0])
+    return [(label, c, r2) for _, label, c, r2 in fits]
+
+def estimate_complexity(func, make_input, start=1000, stop=64000, factor=2, warmup=1, repeat=3):
+    """Times func over a geometric range of n and returns the fits, best first"""
+    sizes = geometric_sizes(max(2, start), stop, factor)
+    return fit_growth(sizes, time_callable(func, make_input, sizes, warmup, repeat))
+
+def check_complexity_regression(name, best_label, history_path):
+    """
+    Records best_label for name in a JSON history file and reports whether
+    the fitted class got worse than the previously recorded one.
+    Returns (previous_label, worsened).
+    """
+    history = {}
+    if os.path.exists(history_path):
+        with open(history_path) as f:
+            history = json.load(f)
+    previous = history.get(name)
+    history[name] = best_label
+    with open(history_path, "w") as f:
+        json.dump(history, f, indent=2)
+    worsened = previous is not None and MODEL_RANK[best_label] > MODEL_RANK[previous]
+    return previous, worsened
+
+def complexity_fit_demo():
+    print("\nEmpirical Complexity Fit:")
+    cases = {
+        "linear loop": (lambda n: n, lambda n: sum(1 for _ in range(n))),
+        "pairwise loop": (lambda n: n, lambda n: sum(1 for i in range(n) for j in range(i))),
+    }
+    for name, (make_input, func) in cases.items():
+        stop = 2 ** 18 if name == "linear loop" else 2 ** 11
+        fits = estimate_complexity(func, make_input, start=stop // 32, stop=stop)
+        label, c, r2 = fits[0]
+        print(f"{name:<15} best fit {label:<10} R^2 = {r2:.3f}")
+
 # Big-O, Omega, Theta demonstrations (analytically)
 def complexity_classes_demo():
     print("\nBig-O, Omega, Theta Demonstration:")
@@ -81,12 +212,35 @@ def complexity_classes_demo():
     print("Worst-case: O(n^2)")
     print("Tight bound: Θ(n^2)")
 
+# Proof of correctness: the fitter on exact synthetic timings
+def test_correctness():
+    print("\n=== Proof of Correctness ===")
+    sizes = geometric_sizes(1000, 64000)
+    assert sizes == [1000, 2000, 4000, 8000, 16000, 32000, 64000]
+    for label, func in [("O(n)", linear), ("O(n log n)", linearithmic), ("O(n^2)", quadratic)]:
+        best, c, r2 = fit_growth(sizes, [3e-9 * func(n) for n in sizes])[0]
+        assert best == label and math.isclose(c, 3e-9) and math.isclose(r2, 1.0)
+    assert fit_growth([4, 8, 12, 16], [2 ** n for n in [4, 8, 12, 16]])[0][0] == "O(2^n)"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        history = os.path.join(tmp, "history.json")
+        assert check_complexity_regression("sort", "O(n log n)", history) == (None, False)
+        assert check_complexity_regression("sort", "O(n log n)", history) == ("O(n log n)", False)
+        assert check_complexity_regression("sort", "O(n^2)", history) == ("O(n log n)", True)
+        assert check_complexity_regression("sort", "O(n)", history) == ("O(n^2)", False)
+    print("✅ Complexity Fit passed")
+
 # Main driver
 def main():
     print("=== Design and Analysis of Algorithms: Unit I ===")
-    plot_growth()
+    try:
+        plot_growth()
+    except ImportError as exc:
+        print(f"Skipping growth plot ({exc})")
     empirical_analysis()
+    complexity_fit_demo()
     complexity_classes_demo()
+    test_correctness()
 
 if __name__ == "__main__":
     main()
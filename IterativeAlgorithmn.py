@@ -2,6 +2,13 @@
 
 import time
 import random
+from bisect import bisect_left, bisect_right, insort
+from BenchmarkSuite import test_time
+
+try:
+    import numpy as np
+except ImportError:  # optional: batched search falls back to pure Python
+    np = None
 
 # ======================
 # Linear Search
@@ -29,6 +36,334 @@ def binary_search(arr, target):
             right = mid - 1
     return -1
 
+# ======================
+# Batched Binary Search
+# ======================
+def _searchsorted_ok(arr, queries):
+    """
+    True when arr and queries become flat NumPy arrays of one comparable
+    kind (numbers or strings); tuple keys and mixed objects are left to
+    the pure-Python walk, which compares them like binary_search does.
+    """
+    try:
+        a, q = np.asarray(arr), np.asarray(queries)
+    except ValueError:  # ragged sequences
+        return False
+    if a.ndim != 1 or q.ndim != 1:
+        return False
+    numeric, text = "biuf", "US"
+    return (a.dtype.kind in numeric and q.dtype.kind in numeric) or \
+           (a.dtype.kind in text and q.dtype.kind in text) or len(a) == 0
+
+def batch_binary_search(arr, queries):
+    """
+    Index of each query in sorted arr, or -1 - one call for many keys.
+    With duplicates the leftmost matching index is returned. Uses NumPy's
+    vectorized searchsorted when available; otherwise the queries are
+    visited in sorted order so the search window only moves forward.
+    Returns a NumPy array for NumPy queries, else a list.
+    """
+    if np is not None and _searchsorted_ok(arr, queries):
+        a = np.asarray(arr)
+        q = np.asarray(queries)
+        if len(a) == 0:
+            idx = np.full(q.shape, -1, dtype=np.int64)
+        else:
+            pos = np.searchsorted(a, q, side="left")
+            clipped = np.minimum(pos, len(a) - 1)
+            idx = np.where((pos < len(a)) & (a[clipped] == q), pos, -1)
+        return idx if isinstance(queries, np.ndarray) else idx.tolist()
+
+    n = len(arr)
+    result = [-1] * len(queries)
+    lo = 0
+    for qi in sorted(range(len(queries)), key=queries.__getitem__):
+        target = queries[qi]
+        lo = bisect_left(arr, target, lo)
+        if lo < n and arr[lo] == target:
+            result[qi] = lo
+    return result
+
+def batch_contains(arr, queries):
+    """True/False per query, like ComplexityClasses.binary_search"""
+    return [i != -1 for i in batch_binary_search(arr, queries)]
+
+# ======================
+# Blocked Sorted List (fast inserts for binary search workloads)
+# ======================
+SORTED_BLOCK_LOAD = 512
+
+class SortedBlockList:
+    """
+    Sorted container made of sorted chunks of load / 2 to 2 * load elements
+    plus a list of chunk maxima. Lookup is a bisect over the maxima then one
+    over a chunk; insert/delete shift only one chunk (O(load)). A Fenwick
+    tree over the chunk lengths turns a chunk number into a global index
+    and back in O(log n); it is rebuilt only when chunks split or merge.
+    """
+    def __init__(self, iterable=(), load=SORTED_BLOCK_LOAD):
+        self.load = load
+        self._lists = []
+        self._maxes = []
+        self._index = None
+        self._len = 0
+        self.update(iterable)
+
+    def update(self, iterable):
+        values = sorted(list(self) + list(iterable))
+        self._lists = [values[i:i + self.load] for i in range(0, len(values), self.load)]
+        self._maxes = [chunk[-1] for chunk in self._lists]
+        self._index = None
+        self._len = len(values)
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        for chunk in self._lists:
+            yield from chunk
+
+    def __repr__(self):
+        return f"SortedBlockList({list(self)})"
+
+    # ---- Fenwick tree over chunk lengths ----
+    def _fenwick(self):
+        if self._index is None:
+            tree = [0] * (len(self._lists) + 1)
+            for pos, chunk in enumerate(self._lists, 1):
+                tree[pos] += len(chunk)
+                parent = pos + (pos & -pos)
+                if parent < len(tree):
+                    tree[parent] += tree[pos]
+            self._index = tree
+        return self._index
+
+    def _resize(self, pos, delta):
+        """Chunk pos changed length by delta"""
+        tree = self._index
+        if tree is None:
+            return
+        pos += 1
+        while pos < len(tree):
+            tree[pos] += delta
+            pos += pos & -pos
+
+    def _offset(self, pos):
+        """Number of elements in the chunks before chunk pos"""
+        tree, total = self._fenwick(), 0
+        while pos:
+            total += tree[pos]
+            pos -= pos & -pos
+        return total
+
+    def _locate(self, index):
+        """(chunk, offset) of global position index"""
+        tree = self._fenwick()
+        pos, step = 0, 1 << (len(tree) - 1).bit_length()
+        while step:
+            nxt = pos + step
+            if nxt < len(tree) and tree[nxt] <= index:
+                pos = nxt
+                index -= tree[nxt]
+            step >>= 1
+        return (pos, index) if pos < len(self._lists) else (len(self._lists), 0)
+
+    # ---- updates ----
+    def add(self, value):
+        if not self._maxes:
+            self._lists.append([value])
+            self._maxes.append(value)
+            self._index = None
+        else:
+            pos = bisect_right(self._maxes, value)
+            if pos == len(self._maxes):
+                pos -= 1
+                self._lists[pos].append(value)
+                self._maxes[pos] = value
+            else:
+                insort(self._lists[pos], value)
+            if len(self._lists[pos]) > 2 * self.load:
+                chunk = self._lists[pos]
+                self._lists[pos:pos + 1] = [chunk[:self.load], chunk[self.load:]]
+                self._maxes[pos:pos + 1] = [chunk[self.load - 1], chunk[-1]]
+                self._index = None
+            else:
+                self._resize(pos, 1)
+        self._len += 1
+
+    def _merge(self, pos):
+        """Joins the undersized chunk pos with a neighbour, re-splitting if too big"""
+        if pos == len(self._lists) - 1:
+            pos -= 1
+        merged = self._lists[pos] + self._lists[pos + 1]
+        if len(merged) > 2 * self.load:
+            half = len(merged) // 2
+            parts = [merged[:half], merged[half:]]
+        else:
+            parts = [merged]
+        self._lists[pos:pos + 2] = parts
+        self._maxes[pos:pos + 2] = [part[-1] for part in parts]
+        self._index = None
+
+    def _find(self, value):
+        """(chunk, offset) of the first element equal to value, or None"""
+        pos = bisect_left(self._maxes, value)
+        if pos == len(self._maxes):
+            return None
+        idx = bisect_left(self._lists[pos], value)
+        if self._lists[pos][idx] == value:
+            return pos, idx
+        return None
+
+    def remove(self, value):
+        found = self._find(value)
+        if found is None:
+            raise ValueError(f"{value!r} not in list")
+        pos, idx = found
+        chunk = self._lists[pos]
+        del chunk[idx]
+        if not chunk:
+            del self._lists[pos]
+            del self._maxes[pos]
+            self._index = None
+        elif len(chunk) < self.load // 2 and len(self._lists) > 1:
+            self._merge(pos)
+        else:
+            self._maxes[pos] = chunk[-1]
+            self._resize(pos, -1)
+        self._len -= 1
+
+    def discard(self, value):
+        if self._find(value) is not None:
+            self.remove(value)
+
+    def __contains__(self, value):
+        return self._find(value) is not None
+
+    def binary_search(self, target):
+        """Global index of target or -1, like binary_search(arr, target)"""
+        found = self._find(target)
+        if found is None:
+            return -1
+        pos, idx = found
+        return self._offset(pos) + idx
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._len)
+            if step != 1:
+                return list(self)[index]
+            result = []
+            pos, idx = self._locate(start)
+            while len(result) < stop - start and pos < len(self._lists):
+                result.extend(self._lists[pos][idx:idx + stop - start - len(result)])
+                pos, idx = pos + 1, 0
+            return result
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("SortedBlockList index out of range")
+        pos, idx = self._locate(index)
+        return self._lists[pos][idx]
+
+    def irange(self, low, high):
+        """Values v with low <= v <= high, in order"""
+        pos = bisect_left(self._maxes, low)
+        if pos == len(self._maxes):
+            return
+        idx = bisect_left(self._lists[pos], low)
+        for chunk in self._lists[pos:]:
+            for value in chunk[idx:]:
+                if high < value:
+                    return
+                yield value
+            idx = 0
+
+# ======================
+# Self-Tuning Search Index
+# ======================
+class SearchIndex:
+    """
+    Wraps a dataset and answers "first index of target or -1" queries.
+    It starts with linear_search and, once the elements scanned so far
+    reach BUILD_FACTOR * n (about what building an index costs), builds a
+    hash index (hashable values) or a sorted index (orderable values).
+    Call invalidate() after changing the data.
+    """
+    BUILD_FACTOR = 2
+
+    def __init__(self, data):
+        self.data = data
+        self.queries = 0
+        self.invalidate()
+
+    def invalidate(self):
+        self.strategy = "linear"
+        self._scanned = 0
+        self._positions = None
+        self._keys = None
+
+    def _build(self):
+        try:
+            positions = {}
+            for i, value in enumerate(self.data):
+                positions.setdefault(value, i)
+            self._positions, self.strategy = positions, "hash"
+            return
+        except TypeError:
+            pass
+        try:
+            # (value, index) order puts the first occurrence of each value first
+            pairs = sorted((value, i) for i, value in enumerate(self.data))
+            self._keys = [value for value, _ in pairs]
+            self._positions = [i for _, i in pairs]
+            self.strategy = "sorted"
+        except TypeError:
+            self.strategy = "unindexable"
+
+    def _maybe_build(self, pending):
+        if self.strategy == "linear" and self._scanned + pending * len(self.data) >= self.BUILD_FACTOR * len(self.data):
+            self._build()
+
+    def _lookup(self, target):
+        if self.strategy == "hash":
+            try:
+                i = self._positions.get(target, -1)
+            except TypeError:  # unhashable query
+                return linear_search(self.data, target)
+            # dict lookup matches by identity first; linear_search uses ==
+            # only, so e.g. nan must not find itself
+            return i if i != -1 and self.data[i] == target else -1
+        if self.strategy == "sorted":
+            try:
+                pos = bisect_left(self._keys, target)
+            except TypeError:  # query not comparable with the data
+                return linear_search(self.data, target)
+            if pos < len(self._keys) and self._keys[pos] == target:
+                return self._positions[pos]
+            return -1
+        index = linear_search(self.data, target)
+        self._scanned += len(self.data) if index == -1 else index + 1
+        return index
+
+    def find(self, target):
+        self.queries += 1
+        self._maybe_build(0)
+        return self._lookup(target)
+
+    def contains(self, target):
+        return self.find(target) != -1
+
+    def find_many(self, targets):
+        """Bulk position query; a large enough batch builds the index up front"""
+        targets = list(targets)
+        self.queries += len(targets)
+        self._maybe_build(len(targets))
+        return [self._lookup(t) for t in targets]
+
+    def contains_many(self, targets):
+        return [i != -1 for i in self.find_many(targets)]
+
 # ======================
 # Insertion Sort
 # ======================
@@ -45,15 +380,131 @@ def insertion_sort(arr):
     return arr
 
 # ======================
-# Time Complexity Tester
+# Adaptive Insertion Sort (binary insertion + natural runs)
 # ======================
-def test_time(func, *args):
-    start = time.time()
-    result = func(*args)
-    end = time.time()
-    print(f"{func.__name__} executed in {(end - start):.6f}s")
+MIN_RUN = 32
+
+def binary_insertion_sort(arr, lo=0, hi=None, start=None):
+    """
+    Sorts arr[lo:hi] in place, assuming arr[lo:start] is already sorted.
+    The insertion point is found by binary search and the shift is one
+    slice assignment. bisect_right keeps equal keys in input order.
+    """
+    if hi is None:
+        hi = len(arr)
+    if start is None:
+        start = lo + 1
+    for i in range(max(start, lo + 1), hi):
+        key = arr[i]
+        pos = bisect_right(arr, key, lo, i)
+        if pos < i:
+            arr[pos + 1:i + 1] = arr[pos:i]
+            arr[pos] = key
+    return arr
+
+def _count_run(arr, lo, hi):
+    """Length of the natural run at lo; a strictly descending run is reversed in place"""
+    run_hi = lo + 1
+    if run_hi == hi:
+        return 1
+    if arr[run_hi] < arr[lo]:
+        while run_hi + 1 < hi and arr[run_hi + 1] < arr[run_hi]:
+            run_hi += 1
+        arr[lo:run_hi + 1] = arr[lo:run_hi + 1][::-1]
+    else:
+        while run_hi + 1 < hi and not arr[run_hi + 1] < arr[run_hi]:
+            run_hi += 1
+    return run_hi + 1 - lo
+
+def _merge_runs(left, right):
+    """Stable two-way merge; ties take from left"""
+    result = []
+    i = j = 0
+    while i < len(left) and j < len(right):
+        if right[j] < left[i]:
+            result.append(right[j])
+            j += 1
+        else:
+            result.append(left[i])
+            i += 1
+    result.extend(left[i:])
+    result.extend(right[j:])
     return result
 
+def adaptive_insertion_sort(arr):
+    """
+    TimSort-style insertion sort for nearly-sorted data: existing ascending
+    (or strictly descending, then reversed) runs are kept, short runs are
+    extended to MIN_RUN with binary insertion, and the runs are merged
+    pairwise. Sorted input costs n - 1 comparisons. Stable, in place.
+    """
+    n = len(arr)
+    runs = []
+    lo = 0
+    while lo < n:
+        length = _count_run(arr, lo, n)
+        if length < MIN_RUN:
+            forced = min(MIN_RUN, n - lo)
+            binary_insertion_sort(arr, lo, lo + forced, lo + length)
+            length = forced
+        runs.append(arr[lo:lo + length])
+        lo += length
+
+    while len(runs) > 1:
+        merged = [_merge_runs(runs[k], runs[k + 1]) for k in range(0, len(runs) - 1, 2)]
+        if len(runs) % 2:
+            merged.append(runs[-1])
+        runs = merged
+    if runs:
+        arr[:] = runs[0]
+    return arr
+
+class _CountingKey:
+    """Wraps a value and counts every comparison made on it"""
+    comparisons = 0
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        _CountingKey.comparisons += 1
+        return self.value < other.value
+
+    def __gt__(self, other):
+        _CountingKey.comparisons += 1
+        return self.value > other.value
+
+def count_comparisons(sort_func, arr):
+    """Number of element comparisons sort_func makes on a copy of arr"""
+    _CountingKey.comparisons = 0
+    sort_func([_CountingKey(x) for x in arr])
+    return _CountingKey.comparisons
+
+def nearly_sorted(n, disorder, seed=0):
+    """Sorted 0..n-1 with a disorder fraction of positions randomly swapped"""
+    rng = random.Random(seed)
+    arr = list(range(n))
+    for _ in range(int(n * disorder / 2)):
+        i, j = rng.randrange(n), rng.randrange(n)
+        arr[i], arr[j] = arr[j], arr[i]
+    return arr
+
+def compare_insertion_sorts(n=2000, disorders=(0.0, 0.01, 0.02, 0.05, 0.10)):
+    """Comparisons and wall time of insertion_sort vs adaptive_insertion_sort"""
+    print(f"\nInsertion sort vs adaptive insertion sort (n = {n}):")
+    print(f"{'disorder':>8} {'cmp (classic)':>14} {'cmp (adaptive)':>15} {'time (classic)':>15} {'time (adaptive)':>16}")
+    for disorder in disorders:
+        data = nearly_sorted(n, disorder)
+        row = []
+        for sort_func in (insertion_sort, adaptive_insertion_sort):
+            row.append(count_comparisons(sort_func, data))
+        for sort_func in (insertion_sort, adaptive_insertion_sort):
+            copy = data.copy()
+            start = time.perf_counter()
+            sort_func(copy)
+            row.append(time.perf_counter() - start)
+        print(f"{disorder:>8.0%} {row[0]:>14} {row[1]:>15} {row[2]:>14.6f}s {row[3]:>15.6f}s")
+
 # ======================
 # Proof of Correctness (Assertions)
 # ======================
@@ -66,6 +517,16 @@ def test_correctness():
     assert insertion_sort(original.copy()) == sorted_copy
     print("Insertion Sort passed ✅")
 
+    for case in ([], [1], original, list(range(100)), list(range(100, 0, -1)), [3] * 50,
+                 nearly_sorted(500, 0.05), [random.randint(0, 20) for _ in range(300)]):
+        assert adaptive_insertion_sort(case.copy()) == sorted(case)
+        assert binary_insertion_sort(case.copy()) == sorted(case)
+    # Stability: wrappers compare by value but list equality is by identity
+    keyed = [_CountingKey(random.randint(0, 5)) for _ in range(200)]
+    assert adaptive_insertion_sort(keyed.copy()) == sorted(keyed, key=lambda w: w.value)
+    assert count_comparisons(adaptive_insertion_sort, list(range(1000))) == 999
+    print("Adaptive Insertion Sort passed ✅")
+
     # Linear search correctness
     data = [10, 20, 30, 40, 50]
     for idx, val in enumerate(data):
@@ -80,6 +541,65 @@ def test_correctness():
     assert binary_search(sorted_data, 4) == -1
     print("Binary Search passed ✅")
 
+    # Batched binary search keeps the single-query conventions
+    queries = [11, 4, 1, 0, 7, 12, 7, 3]
+    assert batch_binary_search(sorted_data, queries) == [binary_search(sorted_data, q) for q in queries]
+    assert batch_contains(sorted_data, queries) == [binary_search(sorted_data, q) != -1 for q in queries]
+    assert batch_binary_search([], [1, 2]) == [-1, -1]
+    assert batch_binary_search([1, 2, 2, 2, 3], [2]) == [1]
+    records = [(1, 2), (3, 4), (5, 6)]
+    assert batch_binary_search(records, [(3, 4), (2, 2)]) == [1, -1]
+    assert batch_binary_search(["ant", "bee", "cat"], ["cat", "dog"]) == [2, -1]
+    print("Batched Binary Search passed ✅")
+
+    # SearchIndex: same answers as linear_search, whatever strategy it picked
+    dup_data = [5, 3, 5, 9, 3, 1]
+    index = SearchIndex(dup_data)
+    assert index.find(3) == 1 and index.strategy == "linear"
+    for target in [5, 9, 1, 3, 7]:
+        assert index.find(target) == linear_search(dup_data, target)
+    assert index.strategy == "hash"
+    assert index.find_many([1, 3, 4]) == [5, 1, -1]
+    assert index.contains_many([9, 10]) == [True, False]
+    lists = [[2], [1], [2], [0]]
+    bulk = SearchIndex(lists)
+    assert bulk.find_many([[2], [0], [7]]) == [0, 3, -1] and bulk.strategy == "sorted"
+    nan = float("nan")
+    nan_index = SearchIndex([nan, 1])
+    assert [nan_index.find(nan) for _ in range(4)] == [-1] * 4 and nan_index.strategy == "hash"
+    assert nan_index.find(1) == 1
+    print("SearchIndex passed ✅")
+
+    # SortedBlockList against a plain sorted list under random updates
+    blocked, reference = SortedBlockList([5, 1, 3], load=4), [1, 3, 5]
+    for _ in range(500):
+        value = random.randint(0, 60)
+        if value in reference and random.random() < 0.4:
+            blocked.remove(value)
+            reference.remove(value)
+        else:
+            blocked.add(value)
+            insort(reference, value)
+        assert list(blocked) == reference and len(blocked) == len(reference)
+    for target in range(-1, 62):
+        expected = bisect_left(reference, target)
+        expected = expected if expected < len(reference) and reference[expected] == target else -1
+        assert blocked.binary_search(target) == expected
+        assert (target in blocked) == (target in reference)
+    assert blocked[3:17] == reference[3:17] and blocked[::3] == reference[::3]
+    assert blocked[-1] == reference[-1] and blocked[len(reference) // 2] == reference[len(reference) // 2]
+    assert list(blocked.irange(10, 20)) == [v for v in reference if 10 <= v <= 20]
+    assert binary_search(blocked, reference[7]) != -1
+
+    # Chunks merge back after heavy deletes, and positions stay right
+    thinned = SortedBlockList(range(6400), load=64)
+    for value in range(6400):
+        if value % 64:
+            thinned.remove(value)
+    assert all(len(chunk) >= 32 for chunk in thinned._lists) and list(thinned) == list(range(0, 6400, 64))
+    assert thinned.binary_search(640) == 10 and thinned[99] == 6336
+    print("SortedBlockList passed ✅")
+
 # ======================
 # Main Function
 # ======================
@@ -95,10 +615,14 @@ def main():
     # Insertion Sort Time
     small_arr = arr[:1000]
     test_time(insertion_sort, small_arr.copy())
+    test_time(adaptive_insertion_sort, small_arr.copy())
+    compare_insertion_sorts()
 
     # Binary Search (requires sorted)
     sorted_arr = sorted(arr)
     test_time(binary_search, sorted_arr, target)
+    test_time(batch_binary_search, sorted_arr, arr)
+    test_time(SearchIndex(arr).find_many, arr[:1000])
 
     test_correctness()
 
@@ -2,25 +2,77 @@
 
 import time
 import random
+import os
+import struct
+from array import array
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from bisect import bisect_right
+from BenchmarkSuite import test_time
+from IterativeAlgorithmn import insertion_sort
+
+try:
+    import numpy as np
+except ImportError:  # optional: bincount fast path for counting_sort
+    np = None
+
+INT64_MIN, INT64_MAX = -(1 << 63), (1 << 63) - 1
 
 # ======================
 # Counting Sort
 # ======================
-def counting_sort(arr):
+COUNTING_SORT_MEMORY_BUDGET = 64 << 20  # bytes allowed for the count array
+
+def counting_sort(arr, key=None, memory_budget=COUNTING_SORT_MEMORY_BUDGET, fallback=True):
+    """
+    Stable counting sort of integers (or of records by an integer key) in place.
+    The counts cover only max - min + 1 slots, so negative and large-but-close
+    keys are fine. Counts and prefix sums live in an array('q') (np.bincount
+    when NumPy is available and no key is given). When the range needs more
+    than memory_budget bytes, the list is sorted with list.sort instead, or
+    ValueError is raised if fallback is False.
+    """
     if not arr:
         return arr
-    max_val = max(arr)
-    count = [0] * (max_val + 1)
-    
-    for num in arr:
-        count[num] += 1
+    keys = arr if key is None else [key(x) for x in arr]
+    min_val, max_val = min(keys), max(keys)
+    size = max_val - min_val + 1
+
+    if size * 8 > memory_budget:
+        if not fallback:
+            raise ValueError(f"counting_sort: key range {size} needs {size * 8} bytes, "
+                             f"over the {memory_budget}-byte budget")
+        arr.sort(key=key)
+        return arr
+
+    if key is None and np is not None and INT64_MIN <= min_val and max_val <= INT64_MAX:
+        counts = np.bincount(np.asarray(arr, dtype=np.int64) - min_val, minlength=size)
+        arr[:] = np.repeat(np.arange(min_val, max_val + 1, dtype=np.int64), counts).tolist()
+        return arr
+
+    count = array('q', [0]) * size
+    for k in keys:
+        count[k - min_val] += 1
+
+    if key is None:
+        index = 0
+        for i, c in enumerate(count):
+            if c:
+                arr[index:index + c] = [i + min_val] * c
+                index += c
+        return arr
 
-    index = 0
+    # Prefix sums turn counts into starting positions; a forward pass keeps it stable
+    total = 0
     for i, c in enumerate(count):
-        for _ in range(c):
-            arr[index] = i
-            index += 1
+        count[i] = total
+        total += c
+    output = [None] * len(arr)
+    for item, k in zip(arr, keys):
+        output[count[k - min_val]] = item
+        count[k - min_val] += 1
+    arr[:] = output
     return arr
 
 # ======================
@@ -60,37 +112,237 @@ def radix_sort(arr):
     return arr
 
 # ======================
-# Bucket Sort
+# Byte-wise Radix Sort (base 256 / 65536)
 # ======================
-def bucket_sort(arr, bucket_size=10):
-    if len(arr) == 0:
+def _float_key(x):
+    """Maps an IEEE double to a uint64 with the same order (NaN sorts last)"""
+    u = struct.unpack(">Q", struct.pack(">d", x))[0]
+    return u ^ 0xFFFFFFFFFFFFFFFF if u >> 63 else u | (1 << 63)
+
+def _exact_float(k):
+    """True when float(k) keeps the value of k exactly"""
+    try:
+        return float(k) == k
+    except OverflowError:
+        return False
+
+def _radix_keys(keys):
+    """
+    Non-negative integer sort keys: ints offset by min, floats via _float_key.
+    None when ints mixed with floats cannot all be converted to float exactly.
+    """
+    if all(isinstance(k, int) for k in keys):
+        low = min(keys)
+        return [k - low for k in keys]
+    if not all(_exact_float(k) for k in keys if isinstance(k, int)):
+        return None
+    return [_float_key(float(k)) for k in keys]
+
+def radix_sort_bytes(arr, digit_bits=8, key=None):
+    """
+    Stable LSD radix sort in place with 8- or 16-bit digits.
+    Handles negative ints (offset by the minimum) and floats (IEEE bit
+    transform); key= sorts records by such a key. Two ping-pong buffers are
+    reused across passes, and a pass is skipped when every key has the same
+    digit. With NumPy the histogram and scatter are vectorized. Ints mixed
+    with floats that do not fit a double exactly fall back to list.sort.
+    """
+    n = len(arr)
+    if n <= 1:
         return arr
-    
-    min_val = min(arr)
-    max_val = max(arr)
+    keys = _radix_keys(arr if key is None else [key(x) for x in arr])
+    if keys is None:
+        arr.sort(key=key)
+        return arr
+    radix, mask = 1 << digit_bits, (1 << digit_bits) - 1
+    passes = -(-max(keys).bit_length() // digit_bits)
 
-    bucket_count = (max_val - min_val) // bucket_size + 1
-    buckets = [[] for _ in range(bucket_count)]
+    if np is not None and max(keys) < (1 << 64):
+        k = np.array(keys, dtype=np.uint64)
+        order = np.arange(n)
+        # Small unsigned digits make NumPy's stable argsort a linear radix pass
+        digit_type = np.uint8 if digit_bits <= 8 else np.uint16 if digit_bits <= 16 else np.int64
+        for p in range(passes):
+            digits = ((k >> np.uint64(p * digit_bits)) & np.uint64(mask)).astype(digit_type)
+            if np.bincount(digits, minlength=radix).max() == n:
+                continue
+            perm = np.argsort(digits, kind="stable")
+            k, order = k[perm], order[perm]
+        arr[:] = [arr[i] for i in order.tolist()]
+        return arr
 
-    for num in arr:
-        idx = (num - min_val) // bucket_size
-        buckets[idx].append(num)
+    src_keys, dst_keys = keys, [0] * n
+    src_items, dst_items = list(arr), [None] * n
+    for p in range(passes):
+        shift = p * digit_bits
+        count = [0] * radix
+        for k in src_keys:
+            count[(k >> shift) & mask] += 1
+        if max(count) == n:
+            continue
+        total = 0
+        for d in range(radix):
+            count[d], total = total, total + count[d]
+        for k, item in zip(src_keys, src_items):
+            d = (k >> shift) & mask
+            dst_keys[count[d]] = k
+            dst_items[count[d]] = item
+            count[d] += 1
+        src_keys, dst_keys = dst_keys, src_keys
+        src_items, dst_items = dst_items, src_items
+    arr[:] = src_items
+    return arr
 
-    sorted_arr = []
-    for bucket in buckets:
-        sorted_arr.extend(sorted(bucket))  # Using built-in sort for small buckets
+# ======================
+# Parallel Radix Sort (shared memory)
+# ======================
+PARALLEL_RADIX_THRESHOLD = 200000  # below this the process pool costs more than it saves
 
-    return sorted_arr
+def _attach(name):
+    shm = shared_memory.SharedMemory(name=name)
+    return shm, shm.buf.cast('Q')
+
+def _radix_histogram(args):
+    name, start, end, shift, mask = args
+    shm, keys = _attach(name)
+    try:
+        count = [0] * (mask + 1)
+        for k in keys[start:end]:
+            count[(k >> shift) & mask] += 1
+        return count
+    finally:
+        keys.release()
+        shm.close()
+
+def _radix_scatter(args):
+    src_name, dst_name, start, end, shift, mask, offsets = args
+    src_shm, src = _attach(src_name)
+    dst_shm, dst = _attach(dst_name)
+    try:
+        for k in src[start:end]:
+            d = (k >> shift) & mask
+            dst[offsets[d]] = k
+            offsets[d] += 1
+    finally:
+        src.release()
+        dst.release()
+        src_shm.close()
+        dst_shm.close()
+
+def parallel_radix_sort(arr, workers=None, digit_bits=8, threshold=PARALLEL_RADIX_THRESHOLD):
+    """
+    LSD radix sort of ints in place across a process pool. Keys (offset by the
+    minimum) live in two shared_memory buffers used ping-pong; per pass each
+    worker histograms its shard, the parent turns the histograms into global
+    per-worker offsets, and each worker scatters its shard straight into the
+    other buffer. Only histograms and offsets are pickled, never the data.
+    Small inputs, one worker or non-int / out-of-range data use radix_sort_bytes.
+    """
+    workers = workers or os.cpu_count() or 1
+    n = len(arr)
+    if n < threshold or workers == 1 or not all(type(x) is int for x in arr):
+        return radix_sort_bytes(arr, digit_bits)
+    low = min(arr)
+    span = max(arr) - low
+    if span >= 1 << 64:
+        return radix_sort_bytes(arr, digit_bits)
+
+    radix, mask = 1 << digit_bits, (1 << digit_bits) - 1
+    passes = -(-span.bit_length() // digit_bits)
+    size = -(-n // workers)
+    bounds = [(start, min(n, start + size)) for start in range(0, n, size)]
+    buffers = [shared_memory.SharedMemory(create=True, size=n * 8) for _ in range(2)]
+    try:
+        view = buffers[0].buf.cast('Q')
+        # the block may be rounded up to a whole page
+        view[:n] = array('Q', [x - low for x in arr])
+        view.release()
+        src, dst = buffers
+        with ProcessPoolExecutor(max_workers=len(bounds)) as pool:
+            for p in range(passes):
+                shift = p * digit_bits
+                hists = list(pool.map(_radix_histogram,
+                                      [(src.name, start, end, shift, mask) for start, end in bounds]))
+                if any(sum(h[d] for h in hists) == n for d in range(radix)):
+                    continue
+                # offsets[w][d]: all keys with a smaller digit, then earlier shards' keys with digit d
+                offsets = [[0] * radix for _ in hists]
+                total = 0
+                for d in range(radix):
+                    for w, h in enumerate(hists):
+                        offsets[w][d] = total
+                        total += h[d]
+                list(pool.map(_radix_scatter,
+                              [(src.name, dst.name, start, end, shift, mask, offsets[w])
+                               for w, (start, end) in enumerate(bounds)]))
+                src, dst = dst, src
+        view = src.buf.cast('Q')
+        arr[:] = [k + low for k in view[:n]]
+        view.release()
+    finally:
+        for shm in buffers:
+            shm.close()
+            shm.unlink()
+    return arr
+
+def benchmark_parallel_radix_sort(n=1_000_000, max_workers=None):
+    """Throughput of parallel_radix_sort for 1..max_workers processes"""
+    max_workers = max_workers or os.cpu_count() or 1
+    data = [random.randint(-2**40, 2**40) for _ in range(n)]
+    for workers in range(1, max_workers + 1):
+        copy = data.copy()
+        start = time.perf_counter()
+        parallel_radix_sort(copy, workers, threshold=0)
+        elapsed = time.perf_counter() - start
+        print(f"workers = {workers:>2}, n = {n}, Time taken = {elapsed:.6f}s, "
+              f"throughput = {n / elapsed / 1e6:.2f} M keys/s")
 
 # ======================
-# Timing Utility
+# Bucket Sort
 # ======================
-def test_time(func, arr):
-    start = time.time()
-    result = func(arr.copy())
-    end = time.time()
-    print(f"{func.__name__} executed in {(end - start):.6f}s")
-    return result
+BUCKET_OVERSAMPLE = 4
+
+def bucket_sort(arr, bucket_size=10):
+    """
+    Sample-sort style bucket sort for ints or floats; returns a new list.
+    The number of buckets is len(arr) / bucket_size, independent of the value
+    range, and the splitters come from a sorted random sample so skewed data
+    still spreads evenly. Small buckets use insertion sort, large ones recurse.
+    NaNs have no order, so they get a bucket of their own at the end (as in
+    radix_sort_bytes).
+    """
+    nans = [num for num in arr if num != num]
+    if nans:
+        return bucket_sort([num for num in arr if num == num], bucket_size) + nans
+    n = len(arr)
+    if n <= 2 * bucket_size:
+        return insertion_sort(list(arr))
+
+    bucket_count = -(-n // bucket_size)
+    sample = sorted(random.sample(arr, min(n, bucket_count * BUCKET_OVERSAMPLE)))
+    splitters = sorted(set(sample[BUCKET_OVERSAMPLE - 1::BUCKET_OVERSAMPLE]))
+    buckets = [[] for _ in range(len(splitters) + 1)]
+    for num in arr:
+        buckets[bisect_right(splitters, num)].append(num)
+
+    if max(len(bucket) for bucket in buckets) == n:
+        # Unlucky sample: every splitter fell on one side of the data.
+        # Split off the minimum and maximum instead; comparing only, so even
+        # ranges that overflow a float still separate.
+        min_val, max_val = min(arr), max(arr)
+        if min_val == max_val:
+            return list(arr)
+        buckets = [[], [], []]
+        for num in arr:
+            buckets[0 if num == min_val else 2 if num == max_val else 1].append(num)
+
+    sorted_arr = []
+    for bucket in buckets:
+        if len(bucket) <= 2 * bucket_size or min(bucket) == max(bucket):
+            sorted_arr.extend(insertion_sort(bucket))
+        else:
+            sorted_arr.extend(bucket_sort(bucket, bucket_size))
+    return sorted_arr
 
 # ======================
 # Proof of Correctness
@@ -103,16 +355,51 @@ def test_correctness():
         [0.42, 0.32, 0.23, 0.52, 0.25, 0.47, 0.51]
     ]
 
-    # Convert float array to int (0-99) for bucket sort test
-    float_to_int = [int(x * 100) for x in test_arrays[2]]
-
     assert counting_sort(test_arrays[0].copy()) == sorted(test_arrays[0])
+    assert counting_sort([3, -2, 10**12, 10**12 - 1, -2]) == [-2, -2, 3, 10**12 - 1, 10**12]
+    mixed = [10**9 + 5, 10**9 + 1, 10**9 + 3, 10**9 + 1]
+    assert counting_sort(mixed.copy(), memory_budget=64) == sorted(mixed)
+    records = [("b", 2), ("a", -1), ("c", 2), ("d", 0), ("e", -1)]
+    assert counting_sort(records.copy(), key=lambda r: r[1]) == sorted(records, key=lambda r: r[1])
+    try:
+        counting_sort([0, 10**9], fallback=False)
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+    assert counting_sort([0, 10**9]) == [0, 10**9]
     print("✅ Counting Sort passed")
 
     assert radix_sort(test_arrays[1].copy()) == sorted(test_arrays[1])
+    for bits in (8, 16):
+        ints = [random.randint(-10**15, 10**15) for _ in range(300)] + [0, -1, 1]
+        assert radix_sort_bytes(ints.copy(), bits) == sorted(ints)
+        floats = [random.uniform(-1e6, 1e6) for _ in range(300)] + [0.0, -0.0, float("inf"), -float("inf"), 1e-300]
+        assert radix_sort_bytes(floats.copy(), bits) == sorted(floats)
+        records = [(random.randint(-5, 5), i) for i in range(200)]
+        assert radix_sort_bytes(records.copy(), bits, key=lambda r: r[0]) == sorted(records, key=lambda r: r[0])
+    assert radix_sort_bytes([2**70, 5, 2**70 - 1]) == [5, 2**70 - 1, 2**70]
+    assert radix_sort_bytes([2**60 + 1, 2**60, 0.5]) == [0.5, 2**60, 2**60 + 1]
+    assert radix_sort_bytes([10**400, 0.5, -3]) == [-3, 0.5, 10**400]
+    assert radix_sort_bytes(test_arrays[1].copy()) == sorted(test_arrays[1])
+    big = [random.randint(-2**50, 2**50) for _ in range(3000)] + [7] * 100
+    for workers in (2, 3):
+        assert parallel_radix_sort(big.copy(), workers, threshold=0) == sorted(big)
+    assert parallel_radix_sort([5] * 10, 2, threshold=0) == [5] * 10
+    assert parallel_radix_sort([0.5, -1.0], 2, threshold=0) == [-1.0, 0.5]
     print("✅ Radix Sort passed")
 
-    assert bucket_sort(float_to_int.copy()) == sorted(float_to_int)
+    assert bucket_sort(test_arrays[2].copy()) == sorted(test_arrays[2])
+    sparse = [random.randint(0, 10**9) for _ in range(50)] + [random.random() for _ in range(50)]
+    assert bucket_sort(sparse, 4) == sorted(sparse)
+    skewed = [random.expovariate(1) ** 4 for _ in range(2000)] + [-3.5] * 300 + [7] * 300
+    assert bucket_sort(skewed) == sorted(skewed)
+    assert bucket_sort([5] * 100) == [5] * 100
+    assert bucket_sort([-1e308] * 500 + [1e308]) == [-1e308] * 500 + [1e308]
+    assert bucket_sort([0] * 500 + [10**400]) == [0] * 500 + [10**400]
+    nan = float("nan")
+    assert len(bucket_sort([nan] * 30)) == 30
+    with_nans = bucket_sort([3.5, nan, -1.0] * 20)
+    assert with_nans[:40] == [-1.0] * 20 + [3.5] * 20 and all(x != x for x in with_nans[40:])
     print("✅ Bucket Sort passed")
 
 # ======================
@@ -125,9 +412,13 @@ def main():
     arr = [random.randint(0, 9999) for _ in range(size)]
 
     print(">> Timing on Random Integers:")
-    test_time(counting_sort, arr)
-    test_time(radix_sort, arr)
-    test_time(bucket_sort, arr)
+    test_time(counting_sort, arr.copy())
+    test_time(radix_sort, arr.copy())
+    test_time(radix_sort_bytes, arr.copy())
+    test_time(bucket_sort, arr.copy())
+
+    print("\n>> Parallel Radix Sort Throughput:")
+    benchmark_parallel_radix_sort(200000, 2)
 
     test_correctness()
 
@@ -1,7 +1,10 @@
 # Unit-IV Lower bounding techniques: Decision Trees
 
 import math
+import random
+import operator
 import itertools
+from array import array
 
 # ======================
 # Concept: Lower Bound using Decision Tree
@@ -10,40 +13,367 @@ import itertools
 def sorting_lower_bound(n):
     """Calculate lower bound of comparison-based sorting using decision tree"""
     perms = math.factorial(n)
-    height = math.ceil(math.log2(perms))
+    height = comparison_lower_bound(n)
     print(f"\nFor sorting {n} elements:")
     print(f"Number of permutations: {perms}")
     print(f"Height of decision tree (min comparisons in worst case): ⌈log₂({perms})⌉ = {height}")
     print(f"⇒ Lower Bound: Ω(n log n)")
 
+def comparison_lower_bound(n):
+    """⌈log₂ n!⌉ via math.lgamma, so large n never builds n! itself"""
+    if n < 2:
+        return 0
+    # lgamma is accurate to ~1e-15 relative; the guard keeps exact values
+    # such as log2(2!) = 1 from rounding up
+    return math.ceil(math.lgamma(n + 1) / math.log(2) - 1e-9)
+
+# ======================
+# Comparison-Optimal Sorting (Ford–Johnson Merge-Insertion)
+# ======================
+
+class MemoComparator:
+    """
+    Wraps an expensive less(a, b) and remembers every answer by item
+    position, so no pair is ever asked twice. calls counts real invocations.
+    """
+    def __init__(self, items, less=operator.lt):
+        self.items = items
+        self.less = less
+        self.cache = {}
+        self.calls = 0
+
+    def __call__(self, i, j):
+        key = (i, j)
+        if key not in self.cache:
+            self.calls += 1
+            result = bool(self.less(self.items[i], self.items[j]))
+            self.cache[key] = result
+            if result:
+                self.cache[(j, i)] = False  # a < b rules out b < a
+        return self.cache[key]
+
+def _jacobsthal_order(last):
+    """Pend numbers 2..last in Ford–Johnson order: 3 2, 5 4, 11 10 ... 6, 21 ..."""
+    order, prev, a, b = [], 1, 1, 3
+    while prev < last:
+        hi = min(b, last)
+        order.extend(range(hi, prev, -1))
+        prev = hi
+        a, b = b, b + 2 * a
+    return order
+
+def _merge_insertion(idx, less):
+    if len(idx) <= 1:
+        return list(idx)
+
+    # 1. Pair up and compare: big of each pair goes on, small waits
+    small_of = {}
+    bigs = []
+    for k in range(0, len(idx) - 1, 2):
+        big, small = idx[k], idx[k + 1]
+        if less(big, small):
+            big, small = small, big
+        bigs.append(big)
+        small_of[big] = small
+    straggler = idx[-1] if len(idx) % 2 else None
+
+    # 2. Recursively sort the bigs; the first big's small is known to be smallest
+    bigs = _merge_insertion(bigs, less)
+    chain = [small_of[bigs[0]]] + bigs
+    pend = [small_of[big] for big in bigs[1:]]
+    if straggler is not None:
+        pend.append(straggler)
+
+    # 3. Binary-insert the rest in Jacobsthal order, each bounded by its big
+    for num in _jacobsthal_order(len(pend) + 1):
+        item = pend[num - 2]
+        hi = chain.index(bigs[num - 1]) if num - 1 < len(bigs) else len(chain)
+        lo = 0
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if less(item, chain[mid]):
+                hi = mid
+            else:
+                lo = mid + 1
+        chain.insert(lo, item)
+    return chain
+
+def merge_insertion_sort(items, less=operator.lt):
+    """
+    Ford–Johnson merge-insertion sort for costly comparators.
+    less(a, b) is called at most once per pair; returns (sorted_items, calls).
+    """
+    compare = MemoComparator(items, less)
+    order = _merge_insertion(list(range(len(items))), compare)
+    return [items[i] for i in order], compare.calls
+
+def comparison_report(items, less=operator.lt):
+    """Sorts with merge_insertion_sort and prints comparisons used vs ⌈log₂ n!⌉"""
+    result, used = merge_insertion_sort(items, less)
+    bound = comparison_lower_bound(len(items))
+    # The bound is for the worst case, so a lucky input can come in under it
+    print(f"n = {len(items)}: {used} comparisons, lower bound ⌈log₂ n!⌉ = {bound}"
+          f" ({used - bound:+d})")
+    return result
+
 # ======================
 # Decision Tree Printer (Toy Example)
 # ======================
 
-def print_decision_tree(elements, depth=0):
-    """Print a textual decision tree (limited to small input for illustration)"""
-    if len(elements) <= 1:
-        print("  " * depth + f"Sorted: {elements}")
+def print_decision_tree(elements, depth=0, max_lines=60):
+    """Print the insertion-sort decision tree for len(elements) items, naming them by elements"""
+    tree = DecisionTree.build(len(elements), "insertion")
+    for line in itertools.islice(tree.render(names=elements), max_lines):
+        print("  " * depth + line)
+    if tree.node_count() > max_lines:
+        print("  " * depth + f"... ({tree.leaf_count()} leaves, height {tree.height()})")
+
+# ======================
+# Permutation Rank / Unrank (Lehmer code)
+# ======================
+# Ranks follow itertools.permutations order (lexicographic by position), so
+# permutations_range(elements, 0, n!) yields exactly what itertools would.
+
+def permutation_rank(perm, elements=None):
+    """Lexicographic rank of perm among the permutations of elements (distinct)"""
+    elements = sorted(perm) if elements is None else list(elements)
+    position = {e: i for i, e in enumerate(elements)}
+    remaining = list(range(len(elements)))
+    rank = 0
+    for i, e in enumerate(perm):
+        digit = remaining.index(position[e])  # Lehmer digit: smaller positions still unused
+        rank += digit * math.factorial(len(perm) - 1 - i)
+        remaining.pop(digit)
+    return rank
+
+def permutation_unrank(rank, elements):
+    """Permutation of elements with the given lexicographic rank"""
+    remaining = list(elements)
+    perm = []
+    for i in range(len(remaining) - 1, -1, -1):
+        digit, rank = divmod(rank, math.factorial(i))
+        perm.append(remaining.pop(digit))
+    return perm
+
+def _next_positions(idx):
+    """Advances a list of positions to the next lexicographic permutation in place"""
+    i = len(idx) - 2
+    while i >= 0 and idx[i] > idx[i + 1]:
+        i -= 1
+    if i < 0:
+        return False
+    j = len(idx) - 1
+    while idx[j] < idx[i]:
+        j -= 1
+    idx[i], idx[j] = idx[j], idx[i]
+    idx[i + 1:] = reversed(idx[i + 1:])
+    return True
+
+def permutations_range(elements, start, stop):
+    """
+    Lazily yields the permutations with ranks in [start, stop) as tuples.
+    Unranks start once, then steps with next-permutation (O(1) amortized).
+    """
+    elements = list(elements)
+    stop = min(stop, math.factorial(len(elements)))
+    if start >= stop:
         return
+    idx = permutation_unrank(start, range(len(elements)))
+    for _ in range(stop - start):
+        yield tuple(elements[i] for i in idx)
+        _next_positions(idx)
+
+def permutation_shards(n, shards):
+    """Splits the n! ranks into shards contiguous [start, stop) ranges of near-equal size"""
+    total = math.factorial(n)
+    return [(total * k // shards, total * (k + 1) // shards) for k in range(shards)]
+
+# ======================
+# Compact Decision Tree (flat arrays, built from the sort itself)
+# ======================
+
+UNSET, LEAF = -1, -2
+
+class _Probe:
+    """Element stand-in whose every comparison is routed through the tree builder"""
+    __slots__ = ("pos", "value", "tree")
 
-    for i in range(len(elements) - 1):
-        a, b = elements[i], elements[i + 1]
-        print("  " * depth + f"Compare {a} and {b}:")
-        less = elements.copy()
-        less[i], less[i + 1] = min(a, b), max(a, b)
-        print("  " * (depth + 1) + f"If {a} < {b} → {less}")
-        print_decision_tree(less, depth + 2)
+    def __init__(self, pos, value, tree):
+        self.pos, self.value, self.tree = pos, value, tree
+
+    def __lt__(self, other):
+        return self.tree._ask(self, other)
+
+    def __gt__(self, other):
+        return self.tree._ask(other, self)
+
+    def __le__(self, other):
+        return not self.tree._ask(other, self)
+
+    def __ge__(self, other):
+        return not self.tree._ask(self, other)
+
+def _decision_tree_sorts():
+    from IterativeAlgorithmn import insertion_sort
+    from DivideandConquer import merge_sort
+    return {
+        "insertion": insertion_sort,
+        "merge": merge_sort,
+        "merge_insertion": lambda items: merge_insertion_sort(items)[0],
+    }
+
+class DecisionTree:
+    """
+    Decision tree of a comparison sort on n distinct items, stored as flat
+    arrays indexed by node id: node i asks "x[left[i]] < x[right[i]]?" and
+    continues at yes[i] or no[i]. Leaves have left[i] == LEAF and leaf[i]
+    holds the rank of the input permutation that ends there. Built by
+    running the sort on every permutation; runs that share a comparison
+    history share the nodes, so the size is about 2 * n! nodes.
+    """
+    def __init__(self, n):
+        self.n = n
+        self.left = array('b', [UNSET])
+        self.right = array('b', [UNSET])
+        self.yes = array('l', [UNSET])
+        self.no = array('l', [UNSET])
+        self.leaf = array('l', [UNSET])
+        self._cur = 0
+
+    def _new_node(self):
+        for column in (self.left, self.right, self.yes, self.no, self.leaf):
+            column.append(UNSET)
+        return len(self.left) - 1
+
+    def _ask(self, a, b):
+        node = self._cur
+        if self.left[node] == UNSET:
+            self.left[node], self.right[node] = a.pos, b.pos
+            self.yes[node] = self._new_node()
+            self.no[node] = self._new_node()
+        elif (self.left[node], self.right[node]) != (a.pos, b.pos):
+            raise ValueError("sort is not deterministic: same history, different comparison")
+        result = a.value < b.value
+        self._cur = self.yes[node] if result else self.no[node]
+        return result
+
+    @classmethod
+    def build(cls, n, sort="insertion"):
+        """Tree for sort ("insertion", "merge", "merge_insertion" or a callable)"""
+        sort_func = _decision_tree_sorts()[sort] if isinstance(sort, str) else sort
+        tree = cls(n)
+        for rank, perm in enumerate(permutations_range(range(n), 0, math.factorial(n))):
+            tree._cur = 0
+            sort_func([_Probe(pos, value, tree) for pos, value in enumerate(perm)])
+            tree.left[tree._cur] = LEAF
+            tree.leaf[tree._cur] = rank
+        return tree
+
+    def node_count(self):
+        return len(self.left)
+
+    def _leaf_depths(self):
+        stack = [(0, 0)]
+        while stack:
+            node, depth = stack.pop()
+            if self.left[node] == LEAF:
+                yield depth
+            elif self.left[node] != UNSET:
+                stack.append((self.yes[node], depth + 1))
+                stack.append((self.no[node], depth + 1))
+
+    def leaf_count(self):
+        return sum(1 for _ in self._leaf_depths())
+
+    def height(self):
+        """Worst-case comparisons; at least comparison_lower_bound(n)"""
+        return max(self._leaf_depths(), default=0)
+
+    def average_depth(self):
+        """Average comparisons over all n! equally likely inputs"""
+        depths = list(self._leaf_depths())
+        return sum(depths) / len(depths) if depths else 0.0
+
+    def render(self, names=None):
+        """Lazily yields the tree as indented text lines, depth first"""
+        names = [f"x{i}" for i in range(self.n)] if names is None else list(names)
+        stack = [(0, 0, "")]
+        while stack:
+            node, depth, edge = stack.pop()
+            pad = "  " * depth + edge
+            if self.left[node] == LEAF:
+                perm = permutation_unrank(self.leaf[node], range(self.n))
+                order = sorted(range(self.n), key=perm.__getitem__)
+                yield pad + "Sorted: " + " < ".join(str(names[i]) for i in order)
+            elif self.left[node] == UNSET:
+                yield pad + "(unreachable)"
+            else:
+                yield pad + f"Compare {names[self.left[node]]} < {names[self.right[node]]}?"
+                stack.append((self.no[node], depth + 1, "no:  "))
+                stack.append((self.yes[node], depth + 1, "yes: "))
+
+    def summary(self):
+        return {"n": self.n, "nodes": self.node_count(), "leaves": self.leaf_count(),
+                "height": self.height(), "average_depth": round(self.average_depth(), 3),
+                "lower_bound": comparison_lower_bound(self.n)}
 
 # ======================
 # Brute Sort to Check All Permutations
 # ======================
 
-def generate_all_sorts(elements):
-    """Simulate all permutations to mimic leaves of decision tree"""
+def generate_all_sorts(elements, start=0, stop=None):
+    """Simulate all permutations to mimic leaves of decision tree (optionally a rank range)"""
     print(f"\nAll possible orderings (leaves of decision tree) for input: {elements}")
-    for i, perm in enumerate(itertools.permutations(elements), 1):
+    stop = math.factorial(len(elements)) if stop is None else stop
+    for i, perm in enumerate(permutations_range(elements, start, stop), start + 1):
         print(f"{i:>2}: {perm}")
 
+# ======================
+# Proof of Correctness
+# ======================
+
+def test_correctness():
+    print("\n=== Proof of Correctness ===")
+    for n in range(2, 300):
+        assert comparison_lower_bound(n) == (math.factorial(n) - 1).bit_length()
+    assert comparison_lower_bound(10**6) == 18488885
+    print("✅ Lower bound via lgamma passed")
+
+    for n in range(1, 9):
+        worst = 0
+        for perm in itertools.permutations(range(n)):
+            result, used = merge_insertion_sort(list(perm))
+            assert result == sorted(perm)
+            worst = max(worst, used)
+        assert worst == [0, 0, 1, 3, 5, 7, 10, 13, 16][n]  # Ford–Johnson worst case
+    calls = []
+    merge_insertion_sort([3, 1, 2, 1], lambda a, b: calls.append((a, b)) or a < b)
+    assert len(calls) == len(set(calls))
+    print("✅ Merge-Insertion Sort passed")
+
+    for n in range(0, 7):
+        elements = list("abcdefg"[:n])
+        perms = list(itertools.permutations(elements))
+        for rank, perm in enumerate(perms):
+            assert permutation_rank(perm, elements) == rank
+            assert tuple(permutation_unrank(rank, elements)) == perm
+        assert list(permutations_range(elements, 0, len(perms))) == perms
+        shards = permutation_shards(n, 4)
+        assert [p for a, b in shards for p in permutations_range(elements, a, b)] == perms
+    assert permutation_rank(permutation_unrank(10**15, range(20))) == 10**15
+    print("✅ Permutation Rank/Unrank passed")
+
+    for sort, heights in (("insertion", [0, 0, 1, 3, 6, 10]),
+                          ("merge_insertion", [0, 0, 1, 3, 5, 7])):
+        for n in range(6):
+            tree = DecisionTree.build(n, sort)
+            assert tree.leaf_count() == math.factorial(n)
+            assert tree.height() == heights[n] >= comparison_lower_bound(n)
+    tree = DecisionTree.build(4, "merge")
+    assert tree.leaf_count() == 24 and tree.height() == 5
+    assert DecisionTree.build(3, "insertion").average_depth() == 16 / 6
+    print("✅ Decision Tree passed")
+
 # ======================
 # Main Function
 # ======================
@@ -54,12 +384,23 @@ def main():
     # Lower Bound Example
     sorting_lower_bound(4)  # Try with 3, 4, 5 for illustration
 
+    # Comparison-optimal sorting against the bound
+    print("\nMerge-insertion sort with a counted comparator:")
+    for n in (5, 12, 100, 1000):
+        comparison_report(random.sample(range(10 * n), n))
+
+    test_correctness()
+
     # Print all leaves (sorted orders)
     generate_all_sorts([1, 2, 3])
 
-    # Visual Decision Tree (limited to very small input due to branching)
-    print("\nTextual Decision Tree (Partial, 3 Elements):")
+    # Visual Decision Tree (rendered lazily, so only the printed lines are produced)
+    print("\nTextual Decision Tree (Insertion Sort, 3 Elements):")
     print_decision_tree([3, 1, 2])
 
+    print("\nDecision Tree Statistics:")
+    for sort in ("insertion", "merge", "merge_insertion"):
+        print(f"{sort:<16} {DecisionTree.build(8, sort).summary()}")
+
 if __name__ == "__main__":
     main()
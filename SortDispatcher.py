@@ -0,0 +1,201 @@
+# Sort Dispatcher: one sort() front end that picks an engine from data statistics
+
+import json
+import random
+import logging
+
+from BenchmarkSuite import measure
+from IterativeAlgorithmn import insertion_sort, adaptive_insertion_sort, nearly_sorted
+from DivideandConquer import merge_sort, hybrid_quick_sort
+from LinearSorting import counting_sort, radix_sort_bytes, bucket_sort, COUNTING_SORT_MEMORY_BUDGET
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_SIZE = 256
+
+# Tuned by calibrate(); see main() for the benchmark that produces them
+THRESHOLDS = {
+    "small_n": 24,                 # at or below this, insertion sort wins
+    "nearly_sorted": 0.97,         # fraction of in-order adjacent pairs
+    "counting_range_factor": 4,    # counting sort while range <= factor * n
+    "duplicate_ratio": 0.5,        # three-way partitioning pays off above this
+}
+
+ENGINES = {
+    "insertion_sort": insertion_sort,
+    "adaptive_insertion_sort": adaptive_insertion_sort,
+    "counting_sort": counting_sort,
+    "radix_sort_bytes": radix_sort_bytes,
+    "bucket_sort": bucket_sort,
+    "hybrid_quick_sort": hybrid_quick_sort,
+    "merge_sort": merge_sort,
+}
+
+# ======================
+# Input Profiling
+# ======================
+def profile(arr, sample_size=SAMPLE_SIZE, rng=random):
+    """
+    Cheap statistics from a sample: element type, n, value range (exact,
+    only for ints, since counting sort must not under-allocate), fraction of
+    sampled adjacent pairs already in order, and duplicate ratio.
+    """
+    n = len(arr)
+    stats = {"n": n, "type": "other", "range": None, "sortedness": 1.0, "duplicate_ratio": 0.0}
+    if n < 2:
+        return stats
+
+    idx = range(n) if n <= sample_size else rng.sample(range(n), sample_size)
+    sample = [arr[i] for i in idx]
+    if all(type(x) is int for x in sample):
+        stats["type"] = "int"
+    elif all(type(x) in (int, float) for x in sample):
+        stats["type"] = "float"
+
+    pairs = [i for i in idx if i + 1 < n]
+    if pairs:
+        try:
+            stats["sortedness"] = sum(1 for i in pairs if not arr[i + 1] < arr[i]) / len(pairs)
+        except TypeError:
+            stats["sortedness"] = 0.0
+    try:
+        stats["duplicate_ratio"] = 1 - len(set(sample)) / len(sample)
+    except TypeError:  # unhashable elements
+        pass
+
+    if stats["type"] == "int" and all(type(x) is int for x in arr):
+        stats["range"] = max(arr) - min(arr) + 1
+    elif stats["type"] == "int":
+        stats["type"] = "float" if all(type(x) in (int, float) for x in arr) else "other"
+    return stats
+
+def choose_engine(stats, thresholds=THRESHOLDS):
+    """Name of the engine in ENGINES to use for a profile()"""
+    n = stats["n"]
+    if n <= thresholds["small_n"]:
+        return "insertion_sort"
+    if stats["sortedness"] >= thresholds["nearly_sorted"]:
+        return "adaptive_insertion_sort"
+    if stats["type"] == "int":
+        size = stats["range"]
+        if size <= thresholds["counting_range_factor"] * n and size * 8 <= COUNTING_SORT_MEMORY_BUDGET:
+            return "counting_sort"
+        return "radix_sort_bytes"
+    if stats["type"] == "float":
+        if stats["duplicate_ratio"] >= thresholds["duplicate_ratio"]:
+            return "hybrid_quick_sort"
+        return "bucket_sort"
+    if stats["duplicate_ratio"] >= thresholds["duplicate_ratio"]:
+        return "hybrid_quick_sort"
+    return "merge_sort"
+
+# ======================
+# Front End
+# ======================
+def sort(arr, thresholds=THRESHOLDS):
+    """Returns a new sorted list, using the engine chosen from a profile of arr"""
+    stats = profile(arr)
+    engine = choose_engine(stats, thresholds)
+    logger.info("sort: n=%d type=%s range=%s sortedness=%.2f duplicates=%.2f -> %s",
+                stats["n"], stats["type"], stats["range"], stats["sortedness"],
+                stats["duplicate_ratio"], engine)
+    return ENGINES[engine](list(arr))
+
+# ======================
+# Calibration Benchmark
+# ======================
+def _faster(a, b, make_args, repeat=3):
+    """True when engine a has a lower median time than engine b"""
+    ta = measure(ENGINES[a], make_args, 1, repeat)["median_ns"]
+    tb = measure(ENGINES[b], make_args, 1, repeat)["median_ns"]
+    return ta < tb
+
+def calibrate(n=5000, seed=0):
+    """
+    Measures the crossover points behind THRESHOLDS on this machine and
+    returns a new thresholds dict (pass it to sort() or save_thresholds()).
+    """
+    rng = random.Random(seed)
+    tuned = dict(THRESHOLDS)
+
+    tuned["small_n"] = 0
+    for size in (8, 12, 16, 24, 32, 48, 64, 96, 128):
+        data = [rng.randint(0, 10**6) for _ in range(size)]
+        if not _faster("insertion_sort", "hybrid_quick_sort", lambda: (data.copy(),)):
+            break
+        tuned["small_n"] = size
+
+    tuned["counting_range_factor"] = 1
+    for factor in (1, 2, 4, 8, 16, 32, 64, 128):
+        data = [rng.randrange(factor * n) for _ in range(n)]
+        if not _faster("counting_sort", "radix_sort_bytes", lambda: (data.copy(),)):
+            break
+        tuned["counting_range_factor"] = factor
+
+    tuned["nearly_sorted"] = 1.0
+    for disorder in (0.0, 0.01, 0.02, 0.05, 0.1, 0.2):
+        data = nearly_sorted(n, disorder, seed)
+        if not _faster("adaptive_insertion_sort", "hybrid_quick_sort", lambda: (data.copy(),)):
+            break
+        in_order = sum(1 for i in range(n - 1) if data[i] <= data[i + 1]) / (n - 1)
+        tuned["nearly_sorted"] = min(tuned["nearly_sorted"], round(in_order, 3))
+
+    tuned["duplicate_ratio"] = 1.0
+    for distinct in (n, n // 2, n // 4, n // 16, n // 64, 4):
+        data = [rng.random() for _ in range(distinct)]
+        data = [rng.choice(data) for _ in range(n)]
+        if _faster("hybrid_quick_sort", "bucket_sort", lambda: (data.copy(),)):
+            tuned["duplicate_ratio"] = round(profile(data, rng=rng)["duplicate_ratio"], 2)
+            break
+    return tuned
+
+def save_thresholds(thresholds, path):
+    with open(path, "w") as f:
+        json.dump(thresholds, f, indent=2)
+
+def load_thresholds(path):
+    """THRESHOLDS updated with a saved calibration"""
+    with open(path) as f:
+        return {**THRESHOLDS, **json.load(f)}
+
+# ======================
+# Proof of Correctness
+# ======================
+def test_correctness():
+    print("\n=== Proof of Correctness ===")
+    cases = {
+        "small": ([5, 2, 9, 1], "insertion_sort"),
+        "nearly sorted": (nearly_sorted(2000, 0.005), "adaptive_insertion_sort"),
+        "dense ints": ([random.randint(-500, 500) for _ in range(2000)], "counting_sort"),
+        "sparse ints": ([random.randint(-10**12, 10**12) for _ in range(2000)], "radix_sort_bytes"),
+        "floats": ([random.uniform(-1, 1) for _ in range(2000)], "bucket_sort"),
+        "repeated floats": ([random.choice([0.5, 1.5, 2.5]) for _ in range(2000)], "hybrid_quick_sort"),
+        "strings": ([str(random.random()) for _ in range(2000)], "merge_sort"),
+    }
+    for name, (data, expected_engine) in cases.items():
+        assert choose_engine(profile(data)) == expected_engine, name
+        original = data.copy()
+        assert sort(data) == sorted(original), name
+        assert data == original, name  # input is left untouched
+    assert sort([]) == [] and sort([3]) == [3]
+    assert sort([3, 1.5, 2]) == [1.5, 2, 3]
+    tuned = calibrate(200)  # smaller than the profiling sample
+    assert tuned.keys() == THRESHOLDS.keys() and 0 <= tuned["duplicate_ratio"] <= 1
+    print("✅ Sort Dispatcher passed")
+
+# ======================
+# Main Function
+# ======================
+def main():
+    print("=== Sort Dispatcher ===\n")
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    sort([random.randint(0, 100) for _ in range(1000)])
+    sort([random.random() for _ in range(1000)])
+
+    print("\n>> Calibrating thresholds:")
+    print(calibrate(2000))
+
+    test_correctness()
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,18 @@
 # Unit-IX String Processing: Finite Automata method, KMP
 
+import os
+import struct
+import sys
+import mmap
+import tempfile
+import time
+import random
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+from collections import deque
+
 # ====================================
 # 1. Finite Automata Method (DFA)
 # ====================================
@@ -21,18 +34,86 @@ def compute_dfa(pattern, alphabet):
     return dfa
 
 def finite_automata_matcher(text, pattern):
-    alphabet = set(text + pattern)
-    dfa = compute_dfa(pattern, alphabet)
-    m = len(pattern)
+    """
+    DFA matcher using the cached, array-backed automaton from compile_dfa.
+    Works on str (pattern characters mapped to dense columns) and bytes
+    (indexed by byte value).
+    """
+    dfa, sigma, m, columns = compile_dfa(pattern)
     state = 0
     result = []
 
-    for i, char in enumerate(text):
-        state = dfa[state].get(char, 0)
+    for i, c in enumerate(_columns(text, columns)):
+        state = dfa[state * sigma + c] if c < sigma else 0
         if state == m:
             result.append(i - m + 1)
     return result
 
+# ------------------------------------
+# Linear-time DFA construction
+# ------------------------------------
+
+DFA_CACHE_SIZE = 128
+
+def _codes(s):
+    """Integer symbols of s: byte values for bytes, code points for str"""
+    if isinstance(s, (bytes, bytearray, memoryview)):
+        return s
+    return map(ord, s)
+
+def _columns(s, columns):
+    """DFA column of each symbol of s; columns is None for bytes"""
+    if columns is None:
+        return s
+    return map(columns.get, s, repeat(0))
+
+def compute_dfa_linear(pattern):
+    """
+    O(m * |alphabet|) DFA construction driven by the LPS fallback.
+    The table is a flat array: dfa[state * sigma + c] = next_state.
+    For bytes c is the byte value and sigma = max byte in pattern + 1; any
+    byte >= sigma does not occur in the pattern and always leads to 0.
+    For str the pattern's distinct characters get columns 1..k (the
+    columns dict) and column 0 stands for every other character, so the
+    table is (m + 1) * (k + 1) however large the code points are.
+    """
+    if isinstance(pattern, str):
+        columns = {}
+        for ch in pattern:
+            columns.setdefault(ch, len(columns) + 1)
+        codes = [columns[ch] for ch in pattern]
+        sigma = len(columns) + 1
+    else:
+        columns = None
+        codes = list(pattern)
+        sigma = max(codes) + 1 if codes else 1
+    m = len(codes)
+    dfa = array('l', [0]) * ((m + 1) * sigma)
+
+    if m:
+        dfa[codes[0]] = 1
+    x = 0  # restart state = lps of the prefix read so far
+    for state in range(1, m + 1):
+        row, x_row = state * sigma, x * sigma
+        dfa[row:row + sigma] = dfa[x_row:x_row + sigma]
+        if state < m:
+            dfa[row + codes[state]] = state + 1
+            x = dfa[x_row + codes[state]]
+    return dfa, sigma, m, columns
+
+@lru_cache(maxsize=DFA_CACHE_SIZE)
+def _compile_dfa(pattern):
+    return compute_dfa_linear(pattern)
+
+def compile_dfa(pattern):
+    """
+    Bounded LRU cache of compiled automata, keyed by pattern.
+    bytearray and memoryview patterns are cached under their bytes value.
+    """
+    if not isinstance(pattern, (str, bytes)):
+        pattern = bytes(pattern)
+    return _compile_dfa(pattern)
+
 # ====================================
 # 2. Knuth-Morris-Pratt (KMP)
 # ====================================
@@ -82,6 +163,344 @@ def kmp_search(text, pattern):
                 i += 1
     return result
 
+# ====================================
+# 3. Aho-Corasick (Multiple Patterns)
+# ====================================
+
+def build_aho_corasick(patterns):
+    """
+    Builds one automaton over the whole pattern set.
+    goto[state][char] = next_state, fail[state] is the KMP-style failure
+    link (longest proper suffix that is also a trie prefix) and
+    output[state] lists the (pattern_id, length) pairs ending at state.
+    """
+    goto = [{}]
+    fail = [0]
+    output = [[]]
+
+    for pid, pattern in enumerate(patterns):
+        if not pattern:
+            continue
+        state = 0
+        for char in pattern:
+            nxt = goto[state].get(char)
+            if nxt is None:
+                nxt = len(goto)
+                goto[state][char] = nxt
+                goto.append({})
+                fail.append(0)
+                output.append([])
+            state = nxt
+        output[state].append((pid, len(pattern)))
+
+    # Breadth-first: a state's failure link is computed from its parent's,
+    # exactly like lps[i] is computed from lps[length - 1] in compute_lps
+    queue = deque(goto[0].values())
+    while queue:
+        state = queue.popleft()
+        for char, nxt in goto[state].items():
+            queue.append(nxt)
+            f = fail[state]
+            while f and char not in goto[f]:
+                f = fail[f]
+            fail[nxt] = goto[f].get(char, 0)
+            output[nxt] = output[nxt] + output[fail[nxt]]
+    return goto, fail, output
+
+def aho_corasick_search(text, patterns):
+    """
+    Single pass over text for every pattern at once.
+    Returns (pattern_id, offset) for each match, in the order the matches
+    end in the text.
+    """
+    goto, fail, output = build_aho_corasick(patterns)
+    state = 0
+    result = []
+
+    for i, char in enumerate(text):
+        while state and char not in goto[state]:
+            state = fail[state]
+        state = goto[state].get(char, 0)
+        for pid, length in output[state]:
+            result.append((pid, i - length + 1))
+    return result
+
+def compare_multi_pattern(text, patterns):
+    """Throughput of one Aho-Corasick pass vs. kmp_search looped per pattern"""
+    start = time.time()
+    ac = aho_corasick_search(text, patterns)
+    ac_time = time.time() - start
+
+    start = time.time()
+    looped = [(pid, pos) for pid, p in enumerate(patterns) if p
+              for pos in kmp_search(text, p)]
+    kmp_time = time.time() - start
+
+    assert sorted(ac) == sorted(looped)
+    mb = len(text) / 1e6
+    print(f"{len(patterns)} patterns over {len(text)} chars, {len(ac)} matches")
+    print(f"Aho-Corasick: {ac_time:.6f}s ({mb / ac_time if ac_time else float('inf'):.2f} MB/s)")
+    print(f"Looped KMP:   {kmp_time:.6f}s ({mb / kmp_time if kmp_time else float('inf'):.2f} MB/s)")
+    return ac_time, kmp_time
+
+# ====================================
+# 4. Streaming Search (Files / mmap)
+# ====================================
+
+STREAM_CHUNK_SIZE = 1 << 20
+
+def iter_chunks(buf, chunk_size=STREAM_CHUNK_SIZE):
+    """Slices a bytes-like or mmap object into chunks of at most chunk_size"""
+    for start in range(0, len(buf), chunk_size):
+        yield buf[start:start + chunk_size]
+
+def iter_file_chunks(f, chunk_size=STREAM_CHUNK_SIZE):
+    """Reads a binary file object chunk by chunk"""
+    return iter(lambda: f.read(chunk_size), b"")
+
+def kmp_search_stream(chunks, pattern):
+    """
+    KMP over an iterable of chunks (all bytes or all str).
+    The pattern index j is carried across chunk boundaries, so matches that
+    straddle two chunks are found; yields global start offsets.
+    """
+    p = list(_codes(pattern))
+    m = len(p)
+    if m == 0:
+        return
+    lps = compute_lps(p)
+    j = 0
+    base = 0
+
+    for chunk in chunks:
+        for i, c in enumerate(_codes(chunk)):
+            while j and c != p[j]:
+                j = lps[j - 1]
+            if c == p[j]:
+                j += 1
+            if j == m:
+                yield base + i - m + 1
+                j = lps[j - 1]
+        base += len(chunk)
+
+def dfa_search_stream(chunks, pattern):
+    """DFA over an iterable of chunks, carrying state across boundaries"""
+    dfa, sigma, m, columns = compile_dfa(pattern)
+    if m == 0:
+        return
+    state = 0
+    base = 0
+
+    for chunk in chunks:
+        for i, c in enumerate(_columns(chunk, columns)):
+            state = dfa[state * sigma + c] if c < sigma else 0
+            if state == m:
+                yield base + i - m + 1
+        base += len(chunk)
+
+def search_file(path, pattern, chunk_size=STREAM_CHUNK_SIZE, method="dfa", use_mmap=False):
+    """
+    Streams a file through the chosen matcher without loading it whole.
+    Memory is bounded by chunk_size, not by the file size.
+    """
+    if isinstance(pattern, str):
+        pattern = pattern.encode()
+    stream = dfa_search_stream if method == "dfa" else kmp_search_stream
+
+    with open(path, "rb") as f:
+        if use_mmap:
+            if os.fstat(f.fileno()).st_size == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                yield from stream(iter_chunks(mm, chunk_size), pattern)
+        else:
+            yield from stream(iter_file_chunks(f, chunk_size), pattern)
+
+# ====================================
+# 5. Parallel Sharded Search
+# ====================================
+
+def _shard_bounds(n, shards):
+    """[start, end) owned by each shard; each is read up to end + m - 1"""
+    size = -(-n // shards)
+    return [(start, min(n, start + size)) for start in range(0, n, size)]
+
+def _search_shard(args):
+    text, start, end, pattern, method = args
+    matcher = finite_automata_matcher if method == "dfa" else kmp_search
+    # Only keep matches that start inside the owned range; the m - 1 overlap
+    # is there to see matches straddling the boundary, not to report them twice
+    return [start + i for i in matcher(text, pattern) if i < end - start]
+
+def _search_file_shard(args):
+    path, start, end, pattern, method = args
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        shard = mm[start:end + len(pattern) - 1]
+    return _search_shard((shard, start, end, pattern, method))
+
+def parallel_search(text, pattern, workers=None, method="kmp"):
+    """
+    Splits text into shards overlapping by len(pattern) - 1, searches them in
+    a process pool and merges the offsets in order.
+    """
+    workers = workers or os.cpu_count() or 1
+    n, m = len(text), len(pattern)
+    if m == 0 or n < m:
+        return []
+    if workers == 1:
+        return _search_shard((text, 0, n, pattern, method))
+
+    tasks = [(text[start:end + m - 1], start, end, pattern, method)
+             for start, end in _shard_bounds(n, workers)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        shards = pool.map(_search_shard, tasks)
+        return sorted(set(pos for shard in shards for pos in shard))
+
+def parallel_search_file(path, pattern, workers=None, method="kmp"):
+    """Same as parallel_search, but each worker mmaps its own shard of the file"""
+    if isinstance(pattern, str):
+        pattern = pattern.encode()
+    workers = workers or os.cpu_count() or 1
+    n, m = os.path.getsize(path), len(pattern)
+    if m == 0 or n < m:
+        return []
+
+    tasks = [(path, start, end, pattern, method)
+             for start, end in _shard_bounds(n, workers)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        shards = pool.map(_search_file_shard, tasks)
+        return sorted(set(pos for shard in shards for pos in shard))
+
+def benchmark_parallel_search(text, pattern, max_workers=None):
+    """Prints how parallel_search scales with the number of workers"""
+    max_workers = max_workers or os.cpu_count() or 1
+    baseline = None
+    for workers in range(1, max_workers + 1):
+        start = time.time()
+        parallel_search(text, pattern, workers)
+        elapsed = time.time() - start
+        baseline = baseline or elapsed
+        print(f"workers = {workers:>2}, Time taken = {elapsed:.6f}s, "
+              f"speedup = {baseline / elapsed if elapsed else float('inf'):.2f}x")
+
+# ====================================
+# 6. Suffix Array Index (Repeated Queries)
+# ====================================
+
+def build_suffix_array(text):
+    """Prefix-doubling construction: sort suffixes by rank pairs, O(n log^2 n)"""
+    n = len(text)
+    rank = list(_codes(text))
+    sa = list(range(n))
+    k = 1
+    while n > 1:
+        key = lambda i: (rank[i], rank[i + k] if i + k < n else -1)
+        sa.sort(key=key)
+        new_rank = [0] * n
+        for idx in range(1, n):
+            new_rank[sa[idx]] = new_rank[sa[idx - 1]] + (key(sa[idx]) != key(sa[idx - 1]))
+        rank = new_rank
+        if rank[sa[-1]] == n - 1:
+            break
+        k *= 2
+    return sa
+
+def build_lcp(text, sa):
+    """Kasai's algorithm: lcp[i] = common prefix of suffixes sa[i - 1] and sa[i]"""
+    n = len(text)
+    rank = [0] * n
+    for i, pos in enumerate(sa):
+        rank[pos] = i
+    lcp = [0] * n
+    h = 0
+    for pos in range(n):
+        if rank[pos] > 0:
+            prev = sa[rank[pos] - 1]
+            while pos + h < n and prev + h < n and text[pos + h] == text[prev + h]:
+                h += 1
+            lcp[rank[pos]] = h
+            if h:
+                h -= 1
+        else:
+            h = 0
+    return lcp
+
+SUFFIX_INDEX_MAGIC = b"SAIX"
+SUFFIX_INDEX_HEADER = struct.Struct("<4s?QQB?")
+
+class SuffixArrayIndex:
+    """
+    Index built once over a fixed text. occurrences() returns the same
+    sorted list of start offsets as kmp_search, in O(m log n) per query.
+    """
+    def __init__(self, text, sa=None, lcp=None):
+        self.text = text
+        self.sa = array('l', build_suffix_array(text) if sa is None else sa)
+        self.lcp = array('l', build_lcp(text, self.sa) if lcp is None else lcp)
+
+    def _range(self, pattern):
+        text, sa, m = self.text, self.sa, len(pattern)
+        lo, hi = 0, len(sa)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if text[sa[mid]:sa[mid] + m] < pattern:
+                lo = mid + 1
+            else:
+                hi = mid
+        first, hi = lo, len(sa)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if text[sa[mid]:sa[mid] + m] <= pattern:
+                lo = mid + 1
+            else:
+                hi = mid
+        return first, lo
+
+    def count(self, pattern):
+        first, last = self._range(pattern)
+        return last - first
+
+    def occurrences(self, pattern):
+        first, last = self._range(pattern)
+        return sorted(self.sa[first:last])
+
+    def save(self, path):
+        """
+        Plain binary layout, no pickle: a header (magic, text kind, text
+        length in bytes, n, item size, byte order) followed by the text as
+        raw bytes or UTF-8 and the sa and lcp arrays as written by tofile.
+        """
+        raw = self.text.encode("utf-8") if isinstance(self.text, str) else bytes(self.text)
+        with open(path, "wb") as f:
+            f.write(SUFFIX_INDEX_HEADER.pack(SUFFIX_INDEX_MAGIC, isinstance(self.text, str),
+                                             len(raw), len(self.sa), self.sa.itemsize,
+                                             sys.byteorder == "little"))
+            f.write(raw)
+            self.sa.tofile(f)
+            self.lcp.tofile(f)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            header = f.read(SUFFIX_INDEX_HEADER.size)
+            if len(header) != SUFFIX_INDEX_HEADER.size:
+                raise ValueError(f"{path}: not a suffix array index")
+            magic, is_str, text_len, n, itemsize, little = SUFFIX_INDEX_HEADER.unpack(header)
+            typecode = next((t for t in "ilq" if array(t).itemsize == itemsize), None)
+            if magic != SUFFIX_INDEX_MAGIC or typecode is None:
+                raise ValueError(f"{path}: not a suffix array index")
+            raw = f.read(text_len)
+            sa, lcp = array(typecode), array(typecode)
+            sa.fromfile(f, n)
+            lcp.fromfile(f, n)
+        if little != (sys.byteorder == "little"):
+            sa.byteswap()
+            lcp.byteswap()
+        text = raw.decode("utf-8") if is_str else raw
+        if len(text) != n:
+            raise ValueError(f"{path}: text and suffix array sizes differ")
+        return cls(text, sa, lcp)
+
 # ===========================
 # Test All Algorithms
 # ===========================
@@ -97,6 +516,24 @@ def test_all():
     print(f"Finite Automata Matches at: {dfa_matches}")
     assert dfa_matches == [10]
 
+    # Linear-time DFA agrees with the textbook construction
+    for p in ["ababd", "aab", "abcabd", "aaaa"]:
+        dfa, sigma, m, columns = compute_dfa_linear(p)
+        slow = compute_dfa(p, set(p + "z"))
+        for state in range(m + 1):
+            for a in set(p):
+                assert dfa[state * sigma + columns[a]] == slow[state][a]
+            assert dfa[state * sigma] == slow[state]["z"]
+    assert finite_automata_matcher(text.encode(), pattern.encode()) == [10]
+    assert finite_automata_matcher("AAAAABAAABA", "AAAA") == [0, 1]
+    emoji = "\U0001F600\U0001F680\U0001F600"
+    assert finite_automata_matcher("a" + emoji * 2 + "\u4e2d", emoji) == [1, 4]
+    assert len(compute_dfa_linear(emoji)[0]) == 4 * 3
+    finite_automata_matcher(text, pattern)
+    assert _compile_dfa.cache_info().hits >= 1
+    assert finite_automata_matcher(text.encode(), bytearray(b"abab")) == kmp_search(text, "abab")
+    assert list(dfa_search_stream(iter_chunks(text.encode(), 4), memoryview(b"ab"))) == kmp_search(text, "ab")
+
     # KMP Matching
     kmp_matches = kmp_search(text, pattern)
     print(f"KMP Matches at: {kmp_matches}")
@@ -107,5 +544,77 @@ def test_all():
     print(kmp_search("AAAAABAAABA", "AAAA"))     # [0]
     print(kmp_search("ABABDABACDABABCABAB", "ABABCABAB"))  # [10]
 
+    # Aho-Corasick Matching
+    patterns = ["he", "she", "his", "hers"]
+    ac_matches = aho_corasick_search("ushers", patterns)
+    print(f"\nAho-Corasick Matches (pattern_id, offset): {ac_matches}")
+    assert sorted(ac_matches) == [(0, 2), (1, 1), (3, 2)]
+
+    patterns = ["ab", "abab", "bab", "ababd", "c"]
+    expected = sorted((pid, pos) for pid, p in enumerate(patterns)
+                      for pos in kmp_search(text, p))
+    assert sorted(aho_corasick_search(text, patterns)) == expected
+
+    # Streaming search across chunk boundaries
+    data = (text * 50).encode()
+    expected = kmp_search(data, pattern.encode())
+    assert list(kmp_search_stream(iter_chunks(data, 7), pattern.encode())) == expected
+    assert list(dfa_search_stream(iter_chunks(data, 3), pattern.encode())) == expected
+    assert list(kmp_search_stream(iter_chunks(text * 50, 4), pattern)) == kmp_search(text * 50, pattern)
+    with tempfile.NamedTemporaryFile(delete=False) as tmp:
+        tmp.write(data)
+    try:
+        for method in ("dfa", "kmp"):
+            assert list(search_file(tmp.name, pattern, 5, method)) == expected
+            assert list(search_file(tmp.name, pattern, 5, method, use_mmap=True)) == expected
+    finally:
+        os.remove(tmp.name)
+    print(f"\nStreaming Matches (50x text, chunked): {len(expected)} found")
+
+    # Parallel sharded search (shards smaller than the pattern overlap)
+    long_text = "ab" * 50 + text * 20
+    for workers in (1, 3, 8):
+        assert parallel_search(long_text, "abab", workers) == kmp_search(long_text, "abab")
+        assert parallel_search(long_text, pattern, workers, "dfa") == kmp_search(long_text, pattern)
+    with tempfile.NamedTemporaryFile(delete=False) as tmp:
+        tmp.write(long_text.encode())
+    try:
+        assert parallel_search_file(tmp.name, "abab", 4) == kmp_search(long_text, "abab")
+    finally:
+        os.remove(tmp.name)
+    print("Parallel Search passed")
+
+    # Suffix array index: build once, query many times
+    index = SuffixArrayIndex(long_text)
+    assert list(index.sa) == sorted(range(len(long_text)), key=lambda i: long_text[i:])
+    for p in ["abab", pattern, "ca", "abcabcab", "zz", "a"]:
+        assert index.occurrences(p) == kmp_search(long_text, p)
+        assert index.count(p) == len(kmp_search(long_text, p))
+    with tempfile.NamedTemporaryFile(delete=False) as tmp:
+        pass
+    try:
+        index.save(tmp.name)
+        loaded = SuffixArrayIndex.load(tmp.name)
+        assert loaded.occurrences(pattern) == index.occurrences(pattern)
+        assert list(loaded.lcp) == list(index.lcp)
+        SuffixArrayIndex("na\u00efve caf\u00e9").save(tmp.name)
+        assert SuffixArrayIndex.load(tmp.name).occurrences("\u00e9") == [9]
+        bindex = SuffixArrayIndex(b"banana")
+        bindex.save(tmp.name)
+        assert SuffixArrayIndex.load(tmp.name).text == b"banana"
+    finally:
+        os.remove(tmp.name)
+    assert list(bindex.lcp) == [0, 1, 3, 0, 0, 2]
+    assert bindex.occurrences(b"ana") == [1, 3]
+    print("Suffix Array Index passed")
+
+    print("\nParallel Search Scaling:")
+    benchmark_parallel_search("".join(random.choice("ab") for _ in range(200000)), "abba", 4)
+
+    print("\nMulti-pattern Throughput:")
+    corpus = "".join(random.choice("abcd") for _ in range(20000))
+    signatures = ["".join(random.choice("abcd") for _ in range(6)) for _ in range(50)]
+    compare_multi_pattern(corpus, signatures)
+
 if __name__ == "__main__":
     test_all()